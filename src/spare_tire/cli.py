@@ -2,20 +2,75 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from spare_tire.download import download_compatible_wheel, list_wheels
 from spare_tire.rename import inspect_wheel, rename_wheel
 
-console = Console()
-err_console = Console(stderr=True)
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from packaging.version import Version
+    from pypi_simple import DistributionPackage
+    from rich.console import Console
+
+T = TypeVar("T")
+
+# Maximum number of packages fetched from an index at the same time
+MAX_PARALLEL_FETCHES = 10
+
+
+@functools.cache
+def _consoles() -> tuple[Console, Console]:
+    """Get the stdout and stderr consoles, importing rich on first use."""
+    from rich.console import Console
+
+    return Console(), Console(stderr=True)
+
+
+def _status(message: str) -> AbstractContextManager[object]:
+    """Show a spinner while working, but only when writing to a terminal."""
+    console, _ = _consoles()
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
+
+
+def _dumps_json(obj: object) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _map_packages(func: Callable[[str], T], packages: Sequence[str]) -> list[T | Exception]:
+    """Call ``func`` for each package concurrently.
+
+    Returns results in input order; a package whose call raised gets the
+    exception in its slot so one failure doesn't abort the others.
+    """
+
+    def call(package: str) -> T | Exception:
+        try:
+            return func(package)
+        except Exception as e:
+            return e
+
+    if len(packages) == 1:
+        return [call(packages[0])]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FETCHES, len(packages))) as pool:
+        return list(pool.map(call, packages))
 
 
 @click.group()
@@ -51,8 +106,9 @@ def rename(
     WHEEL_PATH: Path to the wheel file to rename
     NEW_NAME: New package name (e.g., "icechunk_v1")
     """
+    console, err_console = _consoles()
     try:
-        with console.status(f"[bold blue]Renaming {wheel_path.name}..."):
+        with _status(f"[bold blue]Renaming {wheel_path.name}..."):
             result = rename_wheel(
                 wheel_path,
                 new_name,
@@ -75,11 +131,15 @@ def inspect(wheel_path: Path, as_json: bool) -> None:
 
     WHEEL_PATH: Path to the wheel file to inspect
     """
+    console, err_console = _consoles()
+    from rich.panel import Panel
+    from rich.table import Table
+
     try:
         info = inspect_wheel(wheel_path)
 
         if as_json:
-            click.echo(json.dumps(info, indent=2))
+            click.echo(_dumps_json(info))
         else:
             # Create info table
             table = Table(show_header=False, box=None, padding=(0, 1))
@@ -149,7 +209,7 @@ def inspect(wheel_path: Path, as_json: bool) -> None:
 
 
 @main.command()
-@click.argument("package")
+@click.argument("packages", nargs=-1, required=True)
 @click.option(
     "-o",
     "--output",
@@ -175,6 +235,12 @@ def inspect(wheel_path: Path, as_json: bool) -> None:
     is_flag=True,
     help="List available wheels without downloading",
 )
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="With --list, only show the N newest wheels (default: all)",
+)
 @click.option(
     "--rename",
     "rename_to",
@@ -188,84 +254,137 @@ def inspect(wheel_path: Path, as_json: bool) -> None:
     help="Target Python version (e.g., '3.12'). Defaults to current interpreter.",
 )
 def download(
-    package: str,
+    packages: tuple[str, ...],
     output: Path,
     index_url: str,
     pkg_version: str | None,
     list_only: bool,
+    limit: int | None,
     rename_to: str | None,
     python_version: str | None,
 ) -> None:
-    """🛞 Download a compatible wheel from a package index.
+    """🛞 Download compatible wheels from a package index.
 
-    PACKAGE: Name of the package to download
+    PACKAGES: Names of the packages to download (fetched concurrently)
 
     Examples:
 
         spare-tire download numpy -o ./wheels/
 
+        spare-tire download numpy scipy pandas -o ./wheels/
+
         spare-tire download icechunk -i https://pypi.anaconda.org/scientific-python-nightly-wheels/simple
 
         spare-tire download requests --list
 
+        spare-tire download numpy --list --limit 20
+
         spare-tire download icechunk --version "<2" --rename icechunk_v1 -o ./wheels/
 
         spare-tire download icechunk --python-version 3.12 -o ./wheels/
     """
+    console, err_console = _consoles()
+    from packaging.utils import canonicalize_name
+
+    from spare_tire.download import download_compatible_wheel, list_wheels
+
+    # Repeated names would download to (and clean up) the same file concurrently
+    unique: dict[str, str] = {}
+    for package in packages:
+        unique.setdefault(canonicalize_name(package), package)
+    packages = tuple(unique.values())
+
+    if rename_to and len(packages) > 1:
+        err_console.print("[red]🔧 Error:[/red] --rename can only be used with a single package")
+        sys.exit(1)
+
+    names = ", ".join(packages)
+    failed = False
+
     try:
         if list_only:
             from packaging.version import Version
+            from rich.table import Table
+
+            from spare_tire.download import try_parse_package_version
 
-            with console.status(f"[bold blue]Fetching wheel list for {package}..."):
-                wheels = list_wheels(package, index_url)
+            with _status(f"[bold blue]Fetching wheel list for {names}..."):
+                wheel_lists = _map_packages(lambda p: list_wheels(p, index_url), packages)
 
-            if not wheels:
-                err_console.print(f"[red]🔧[/red] No wheels found for [bold]{package}[/bold]")
-                sys.exit(1)
+            def version_key(w: DistributionPackage) -> Version:
+                # Non-PEP 440 versions sort last
+                return try_parse_package_version(w.version) or Version("0")
 
-            table = Table(title=f"Available wheels for [bold]{package}[/bold]")
-            table.add_column("Filename", style="cyan")
-            table.add_column("Version", style="green")
+            for package, wheels in zip(packages, wheel_lists, strict=True):
+                if isinstance(wheels, Exception):
+                    err_console.print(f"[red]🔧 Error:[/red] {package}: {wheels}")
+                    failed = True
+                    continue
 
-            for wheel in sorted(
-                wheels,
-                key=lambda w: Version(w.version) if w.version else Version("0"),
-                reverse=True,
-            ):
-                table.add_row(wheel.filename, wheel.version or "unknown")
+                if not wheels:
+                    err_console.print(f"[red]🔧[/red] No wheels found for [bold]{package}[/bold]")
+                    failed = True
+                    continue
 
-            console.print(table)
+                if limit is not None and limit < len(wheels):
+                    shown = heapq.nlargest(limit, wheels, key=version_key)
+                    caption = f"Showing {limit} of {len(wheels)} wheels"
+                else:
+                    shown = sorted(wheels, key=version_key, reverse=True)
+                    caption = None
+
+                table = Table(title=f"Available wheels for [bold]{package}[/bold]", caption=caption)
+                table.add_column("Filename", style="cyan")
+                table.add_column("Version", style="green")
+
+                for wheel in shown:
+                    table.add_row(wheel.filename, wheel.version or "unknown")
+
+                console.print(table)
         else:
-            with console.status(f"[bold blue]Finding compatible wheel for {package}..."):
-                result = download_compatible_wheel(
-                    package,
-                    output,
-                    index_url=index_url,
-                    version=pkg_version,
-                    python_version=python_version,
-                    show_progress=False,  # We use rich status instead
+            with _status(f"[bold blue]Finding compatible wheel for {names}..."):
+                results = _map_packages(
+                    lambda p: download_compatible_wheel(
+                        p,
+                        output,
+                        index_url=index_url,
+                        version=pkg_version,
+                        python_version=python_version,
+                        show_progress=False,  # We use rich status instead
+                    ),
+                    packages,
                 )
 
-            if result is None:
-                err_console.print(
-                    f"[red]🔧[/red] No compatible wheel found for [bold]{package}[/bold]"
-                )
-                sys.exit(1)
+            for package, result in zip(packages, results, strict=True):
+                if isinstance(result, Exception):
+                    err_console.print(f"[red]🔧 Error:[/red] {package}: {result}")
+                    failed = True
+                    continue
+
+                if result is None:
+                    err_console.print(
+                        f"[red]🔧[/red] No compatible wheel found for [bold]{package}[/bold]"
+                    )
+                    failed = True
+                    continue
 
-            console.print(f"[green]🛞 Downloaded:[/green] [bold]{result}[/bold]")
+                console.print(f"[green]🛞 Downloaded:[/green] [bold]{result}[/bold]")
 
-            # Optionally rename the wheel
-            if rename_to:
-                with console.status(f"[bold blue]Renaming to {rename_to}..."):
-                    renamed = rename_wheel(result, rename_to, output_dir=output)
-                # Remove the original downloaded wheel
-                result.unlink()
-                console.print(f"[green]🛞 Renamed:[/green] [bold]{renamed}[/bold]")
+                # Optionally rename the wheel
+                if rename_to:
+                    with _status(f"[bold blue]Renaming to {rename_to}..."):
+                        renamed = rename_wheel(result, rename_to, output_dir=output)
+                    # Remove the original downloaded wheel
+                    result.unlink()
+                    console.print(f"[green]🛞 Renamed:[/green] [bold]{renamed}[/bold]")
 
     except Exception as e:
         err_console.print(f"[red]🔧 Error:[/red] {e}")
         sys.exit(1)
 
+    if failed:
+        sys.exit(1)
+
 
 @main.command()
 @click.option(
@@ -298,12 +417,33 @@ def download(
     type=int,
     help="Port to listen on (default: 8000)",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory to cache renamed wheels in (default: ~/.cache/spare-tire/renamed-v0)",
+)
+@click.option(
+    "--cache-max-size",
+    "cache_max_size_mb",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Most MiB of renamed wheels to keep cached (default: 2048)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't cache renamed wheels on disk",
+)
 def serve(
     config: Path | None,
     upstream: tuple[str, ...],
     renames: tuple[str, ...],
     host: str,
     port: int,
+    cache_dir: Path | None,
+    cache_max_size_mb: int | None,
+    no_cache: bool,
 ) -> None:
     """🛞 Start a PEP 503 proxy server with package renaming.
 
@@ -325,6 +465,7 @@ def serve(
         [proxy]
         host = "127.0.0.1"
         port = 8000
+        cache_max_size_mb = 2048
 
         [[proxy.upstreams]]
         url = "https://pypi.org/simple/"
@@ -332,6 +473,9 @@ def serve(
         [renames]
         icechunk = { name = "icechunk_v1", version = "<2" }
     """
+    console, err_console = _consoles()
+    from rich.panel import Panel
+
     try:
         import uvicorn
 
@@ -352,6 +496,9 @@ def serve(
             renames=renames if renames else None,
             host=host,
             port=port,
+            cache_dir=cache_dir,
+            cache_max_size_mb=cache_max_size_mb,
+            no_cache=no_cache,
         )
 
         if not cfg.upstreams:
@@ -8,29 +8,200 @@ Uses pypi-simple for PEP 503 parsing and packaging.tags for platform matching.
 
 from __future__ import annotations
 
+import atexit
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import shutil
 import sys
-from typing import TYPE_CHECKING
+import threading
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from packaging.specifiers import SpecifierSet
-from packaging.tags import Tag, compatible_tags, cpython_tags, sys_tags
-from packaging.version import Version
-from pypi_simple import PyPISimple
+from packaging.utils import InvalidWheelFilename, canonicalize_name, parse_wheel_filename
+from packaging.version import InvalidVersion, Version
+
+from spare_tire.rename import make_temp_file
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Mapping, Sequence
+
+    from packaging.tags import Tag
+    from pypi_simple import DistributionPackage, PyPISimple
+
+# Block size for copying downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+# Per-thread clients: requests sessions aren't guaranteed to be thread-safe
+_thread_clients = threading.local()
+
+
+def _get_client(index_url: str) -> PyPISimple:
+    """Get this thread's client for an index, reusing its HTTP session across calls.
+
+    Each thread gets its own client (and session), so concurrent downloads
+    never share one. Clients are closed at interpreter exit.
+    """
+    from pypi_simple import PyPISimple
+
+    clients: dict[str, PyPISimple] = _thread_clients.__dict__.setdefault("clients", {})
+    client = clients.get(index_url)
+    if client is None:
+        client = clients[index_url] = PyPISimple(index_url)
+        atexit.register(client.s.close)
+    return client
+
+
+def _page_cache_path(index_url: str, package: str) -> Path:
+    """Get the cache file for a project page.
+
+    Lives under ``$XDG_CACHE_HOME/spare-tire/simple-v1/`` (default ``~/.cache``),
+    with one directory per index URL.
+    """
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    index_key = hashlib.sha256(index_url.encode("utf-8")).hexdigest()[:16]
+    cache_dir = cache_root / "spare-tire" / "simple-v1" / index_key
+    return cache_dir / f"{canonicalize_name(package)}.json"
+
 
+def _package_to_json(pkg: DistributionPackage) -> dict[str, Any]:
+    """Convert a package to JSON-compatible data, keeping every field."""
+    data = dataclasses.asdict(pkg)
+    if pkg.upload_time is not None:
+        data["upload_time"] = pkg.upload_time.isoformat()
+    return data
+
+
+def _package_from_json(data: dict[str, Any]) -> DistributionPackage:
+    """Rebuild a package from the output of ``_package_to_json``."""
     from pypi_simple import DistributionPackage
 
+    if data.get("upload_time") is not None:
+        data["upload_time"] = datetime.fromisoformat(data["upload_time"])
+    return DistributionPackage(**data)
+
+
+def _read_page_cache(path: Path) -> tuple[str, list[DistributionPackage]] | None:
+    """Read a cached project page, returning (etag, packages) or None on a miss."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        packages = [_package_from_json(pkg) for pkg in data["packages"]]
+        return data["etag"], packages
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_page_cache(path: Path, etag: str, packages: list[DistributionPackage]) -> None:
+    """Atomically write a project page to the cache (best effort)."""
+    data = {
+        "etag": etag,
+        "packages": [_package_to_json(pkg) for pkg in packages],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = make_temp_file(path.parent)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        Path(tmp_name).replace(path)
+    except OSError:
+        pass
+
+
+def _get_project_packages(client: PyPISimple, package: str) -> list[DistributionPackage]:
+    """Fetch all packages on a project page, revalidating the on-disk cache.
+
+    A cached page is sent with ``If-None-Match`` so an unchanged page comes back
+    as a 304 and is served from the cache without transferring or parsing it.
+    """
+    from pypi_simple import NoSuchProjectError, ProjectPage
+
+    url = client.get_project_url(package)
+    cache_path = _page_cache_path(client.endpoint, package)
+    cached = _read_page_cache(cache_path)
+
+    headers = {"Accept": client.accept}
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    r = client.s.get(url, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        return cached[1]
+    if r.status_code == 404:
+        raise NoSuchProjectError(package, url)
+    r.raise_for_status()
+
+    packages = list(ProjectPage.from_response(r, package).packages)
+    etag = r.headers.get("ETag")
+    if etag:
+        _write_page_cache(cache_path, etag, packages)
+    return packages
 
-def get_compatible_tags(python_version: str | None = None) -> list[Tag]:
-    """Get ordered list of compatible tags for current platform.
+
+def _stream_to(client: PyPISimple, url: str, path: Path) -> None:
+    """Stream a file from ``url`` to ``path`` in large blocks.
+
+    The download goes to a temporary file next to ``path``, moved into place
+    only once complete, so a failed download never leaves or removes a file
+    at ``path``.
+    """
+    with client.s.get(url, stream=True) as r:
+        r.raise_for_status()
+        # Let urllib3 undo any Content-Encoding while copying from the raw stream
+        r.raw.decode_content = True
+        fd, tmp_name = make_temp_file(path.parent)
+        try:
+            with os.fdopen(fd, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                shutil.copyfileobj(r.raw, f, _DOWNLOAD_CHUNK_SIZE)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_package_version(version: str | None) -> Version:
+    """Parse a package version ("0" if unknown).
+
+    Cached, since the same version strings are parsed repeatedly when filtering,
+    sorting, and selecting wheels from a project page.
+    """
+    return Version(version) if version else Version("0")
+
+
+@functools.lru_cache(maxsize=4096)
+def try_parse_package_version(version: str | None) -> Version | None:
+    """Parse a package version like :func:`parse_package_version`.
+
+    Returns None instead of raising for versions that aren't valid PEP 440,
+    which some indexes serve for old or hand-uploaded files.
+    """
+    try:
+        return parse_package_version(version)
+    except InvalidVersion:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def get_compatible_tags(python_version: str | None = None) -> tuple[Tag, ...]:
+    """Get ordered compatible tags for current platform.
+
+    Platform detection is only done once per Python version; the result is
+    cached and returned as an immutable tuple.
 
     Args:
         python_version: Optional Python version string (e.g., "3.12", "3.11").
                        If None, uses the current interpreter's version.
     """
+    from packaging.tags import compatible_tags, cpython_tags, sys_tags
+
     if python_version is None:
-        return list(sys_tags())
+        return tuple(sys_tags())
 
     # Parse version string like "3.12" -> (3, 12)
     parts = python_version.split(".")
@@ -44,65 +215,87 @@ def get_compatible_tags(python_version: str | None = None) -> list[Tag]:
     tags: list[Tag] = []
     tags.extend(cpython_tags(python_version=py_version))
     tags.extend(compatible_tags(python_version=py_version))
-    return tags
+    return tuple(tags)
 
 
-def parse_wheel_tags(filename: str) -> list[Tag]:
-    """Extract platform tags from a wheel filename."""
-    # Format: {dist}-{ver}(-{build})?-{py}-{abi}-{plat}.whl
-    name = filename[:-4]  # Remove .whl
-    parts = name.split("-")
+@functools.lru_cache(maxsize=16)
+def get_tag_priority(python_version: str | None = None) -> Mapping[Tag, int]:
+    """Get a read-only map of compatible tag -> priority (lower is better).
 
-    if len(parts) < 5:
-        return []
+    Built once per Python version from :func:`get_compatible_tags`.
+    """
+    compatible = get_compatible_tags(python_version)
+    return MappingProxyType({tag: i for i, tag in enumerate(compatible)})
 
-    # Handle optional build tag (starts with digit)
-    if len(parts) >= 6 and parts[2][0].isdigit():
-        py_tag = parts[3]
-        abi_tag = parts[4]
-        plat_tags = parts[5].split(".")
-    else:
-        py_tag = parts[2]
-        abi_tag = parts[3]
-        plat_tags = parts[4].split(".")
 
-    return [Tag(py_tag, abi_tag, plat) for plat in plat_tags]
+@functools.lru_cache(maxsize=8192)
+def parse_wheel_tags(filename: str) -> frozenset[Tag]:
+    """Extract platform tags from a wheel filename.
+
+    Compressed tag sets (e.g. ``py2.py3-none-any``) are expanded. Returns an
+    empty set for invalid filenames. Results are cached per filename, since the
+    same files are scanned repeatedly.
+    """
+    try:
+        return parse_wheel_filename(filename)[3]
+    except InvalidWheelFilename:
+        return frozenset()
 
 
 def best_wheel(
     packages: list[DistributionPackage],
-    compatible_tags: list[Tag] | None = None,
+    compatible_tags: Sequence[Tag] | None = None,
+    *,
+    tag_priority: Mapping[Tag, int] | None = None,
+    prefiltered: bool = False,
 ) -> DistributionPackage | None:
-    """Find the best compatible wheel (highest version, most specific tag)."""
-    if compatible_tags is None:
-        compatible_tags = get_compatible_tags()
-
-    # Create tag priority map (lower index = higher priority)
-    tag_priority = {tag: i for i, tag in enumerate(compatible_tags)}
+    """Find the best compatible wheel (highest version, most specific tag).
 
-    compatible: list[tuple[DistributionPackage, Version, int]] = []
-
-    for pkg in packages:
-        if pkg.package_type != "wheel":
+    Args:
+        packages: Candidate packages from a project page
+        compatible_tags: Ordered compatible tags (default: current interpreter)
+        tag_priority: Precomputed tag -> priority map, lower is better, used
+                      instead of ``compatible_tags`` (see :func:`get_tag_priority`)
+        prefiltered: Whether ``packages`` already contains only wheels
+    """
+    if tag_priority is None:
+        if compatible_tags is None:
+            tag_priority = get_tag_priority()
+        else:
+            tag_priority = {tag: i for i, tag in enumerate(compatible_tags)}
+
+    priority_keys = tag_priority.keys()
+
+    # Newest first: the scan can stop once the newest version with a compatible
+    # wheel has been fully checked, or as soon as a perfect tag match is found.
+    # Wheels whose version can't be parsed can't be ranked, so they are skipped.
+    candidates = [
+        (version, pkg)
+        for pkg in packages
+        if (prefiltered or pkg.package_type == "wheel")
+        and (version := try_parse_package_version(pkg.version)) is not None
+    ]
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    best_pkg: DistributionPackage | None = None
+    best_version = Version("0")
+    best_priority = sys.maxsize
+
+    for version, pkg in candidates:
+        if best_pkg is not None and version < best_version:
+            break
+
+        hits = parse_wheel_tags(pkg.filename) & priority_keys
+        if not hits:
             continue
 
-        wheel_tags = parse_wheel_tags(pkg.filename)
-        best_priority = float("inf")
-
-        for tag in wheel_tags:
-            if tag in tag_priority:
-                best_priority = min(best_priority, tag_priority[tag])
-
-        if best_priority < float("inf"):
-            version = Version(pkg.version) if pkg.version else Version("0")
-            compatible.append((pkg, version, int(best_priority)))
+        priority = min(tag_priority[tag] for tag in hits)
+        if priority < best_priority:
+            best_pkg, best_version, best_priority = pkg, version, priority
+            if priority == 0:
+                break
 
-    if not compatible:
-        return None
-
-    # Sort by version (descending), then tag priority (ascending)
-    compatible.sort(key=lambda x: (-x[1].major, -x[1].minor, -x[1].micro, x[2]))
-    return compatible[0][0]
+    return best_pkg
 
 
 def list_wheels(
@@ -110,9 +303,8 @@ def list_wheels(
     index_url: str = "https://pypi.org/simple/",
 ) -> list[DistributionPackage]:
     """List available wheel files for a package."""
-    with PyPISimple(index_url) as client:
-        page = client.get_project_page(package)
-        return [p for p in page.packages if p.package_type == "wheel"]
+    packages = _get_project_packages(_get_client(index_url), package)
+    return [p for p in packages if p.package_type == "wheel"]
 
 
 def download_compatible_wheel(
@@ -136,40 +328,48 @@ def download_compatible_wheel(
     Returns:
         Path to downloaded wheel, or None if no compatible wheel found
     """
-    from pathlib import Path as PathLib
-
-    output_dir = PathLib(output_dir)
+    output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with PyPISimple(index_url) as client:
-        page = client.get_project_page(package)
-        packages = list(page.packages)
-
-        if not packages:
-            print(f"No packages found for {package}", file=sys.stderr)
-            return None
+    client = _get_client(index_url)
+    packages = _get_project_packages(client, package)
 
-        wheels = [p for p in packages if p.package_type == "wheel"]
+    if not packages:
+        print(f"No packages found for {package}", file=sys.stderr)
+        return None
 
-        if version:
-            # Use packaging.specifiers for PEP 440 version matching
-            specifier = SpecifierSet(version, prereleases=True)
-            wheels = [w for w in wheels if w.version and Version(w.version) in specifier]
-            if not wheels:
-                print(f"No wheels found for {package} matching {version}", file=sys.stderr)
-                return None
+    # Use packaging.specifiers for PEP 440 version matching
+    specifier = SpecifierSet(version, prereleases=True) if version else None
+
+    # Select wheels and apply the version constraint in a single pass
+    wheels = [
+        p
+        for p in packages
+        if p.package_type == "wheel"
+        and (
+            specifier is None
+            or (
+                p.version
+                and (parsed := try_parse_package_version(p.version)) is not None
+                and parsed in specifier
+            )
+        )
+    ]
+
+    if specifier is not None and not wheels:
+        print(f"No wheels found for {package} matching {version}", file=sys.stderr)
+        return None
 
-        compatible_tags = get_compatible_tags(python_version)
-        wheel = best_wheel(wheels, compatible_tags)
+    wheel = best_wheel(wheels, tag_priority=get_tag_priority(python_version), prefiltered=True)
 
-        if wheel is None:
-            print(f"No compatible wheel found for {package} on this platform", file=sys.stderr)
-            return None
+    if wheel is None:
+        print(f"No compatible wheel found for {package} on this platform", file=sys.stderr)
+        return None
 
-        if show_progress:
-            print(f"Found: {wheel.filename}")
+    if show_progress:
+        print(f"Found: {wheel.filename}")
 
-        output_path = output_dir / wheel.filename
-        # verify=False because some indexes (like Anaconda.org) don't provide digests
-        client.download_package(wheel, output_path, verify=False)
-        return output_path
+    output_path = output_dir / wheel.filename
+    # Digests are not verified because some indexes (like Anaconda.org) don't provide them
+    _stream_to(client, wheel.url, output_path)
+    return output_path
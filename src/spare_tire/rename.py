@@ -2,27 +2,78 @@
 
 from __future__ import annotations
 
+import base64
+import csv
+import functools
 import hashlib
+import io
+import os
 import re
+import secrets
+import shutil
+import struct
+import sys
+import tempfile
 import zipfile
+import zlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable
+    from typing import IO
 
+# Chunk size for copying entries that don't need rewriting
+_COPY_CHUNK_SIZE = 64 * 1024
 
+# DEFLATE level for the output wheel. Renamed wheels are installed once rather
+# than archived, so the fastest level is worth the slightly larger file.
+_COMPRESS_LEVEL = 1
+
+# Entries with these compression methods are copied without recompressing
+_RAW_COPY_TYPES = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+# zipfile has no public API for copying compressed data between archives, so
+# the raw copy uses its local file header layout (undocumented module constants)
+_LOCAL_FILE_HEADER = struct.Struct(
+    zipfile.structFileHeader  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType] - private, untyped
+)
+_LOCAL_FILE_HEADER_MAGIC: bytes = zipfile.stringFileHeader  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType] - private, untyped
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+_METADATA_NAME_RE = re.compile(rb"^Name:[^\r\n]*", re.MULTILINE)
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+# Flags for creating a new temporary file; O_BINARY only exists on Windows
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_name(name: str) -> str:
     """Normalize a package name according to PEP 503."""
-    return re.sub(r"[-_.]+", "_", name).lower()
+    return _NORMALIZE_RE.sub("_", name).lower()
+
+
+def _format_record_hash(digest: bytes) -> str:
+    """Format a SHA256 digest for RECORD (base64 urlsafe, no padding)."""
+    return "sha256=" + base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
 
 def _compute_record_hash(data: bytes) -> str:
     """Compute SHA256 hash in RECORD format (base64 urlsafe, no padding)."""
-    import base64
+    return _format_record_hash(hashlib.sha256(data, usedforsecurity=False).digest())
 
-    digest = hashlib.sha256(data).digest()
-    return "sha256=" + base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+def _compute_record_hash_streaming(chunks: Iterable[bytes]) -> tuple[str, int]:
+    """Compute the RECORD hash and size of content supplied in chunks."""
+    h = hashlib.sha256(usedforsecurity=False)
+    size = 0
+    for chunk in chunks:
+        h.update(chunk)
+        size += len(chunk)
+    return _format_record_hash(h.digest()), size
 
 
 def _parse_wheel_filename(filename: str) -> dict[str, str]:
@@ -30,8 +81,11 @@ def _parse_wheel_filename(filename: str) -> dict[str, str]:
 
     Format: {distribution}-{version}(-{build})?-{python}-{abi}-{platform}.whl
     """
-    name = Path(filename).stem  # Remove .whl
-    parts = name.split("-")
+    if not filename.endswith(".whl"):
+        raise ValueError(f"Invalid wheel filename: {filename}")
+
+    # At most six components, so there is no need to split any further
+    parts = filename[:-4].split("-", 5)
 
     if len(parts) < 5:
         raise ValueError(f"Invalid wheel filename: {filename}")
@@ -66,50 +120,350 @@ def _build_wheel_filename(components: dict[str, str]) -> str:
     return "-".join(parts) + ".whl"
 
 
-def _iter_wheel_files(wheel_path: Path) -> Iterator[tuple[str, bytes]]:
-    """Iterate over all files in a wheel, yielding (name, content) tuples."""
-    with zipfile.ZipFile(wheel_path, "r") as zf:
-        for name in zf.namelist():
-            yield name, zf.read(name)
-
-
 def _update_metadata(content: bytes, _old_name: str, new_name: str) -> bytes:
     """Update the METADATA file with the new package name."""
-    text = content.decode("utf-8")
-    lines = text.split("\n")
-    new_lines = []
-
-    for line in lines:
-        if line.startswith("Name:"):
-            # Replace the package name
-            new_lines.append(f"Name: {new_name}")
-        else:
-            new_lines.append(line)
+    # Only the first Name: header; the description body may contain lines like it
+    return _METADATA_NAME_RE.sub(b"Name: " + new_name.encode("utf-8"), content, count=1)
+
 
-    return "\n".join(new_lines).encode("utf-8")
+def _rename_module_prefix(target: bytes, old_name: bytes, new_name: bytes) -> bytes:
+    """Rename the module at the start of an import target if it is ``old_name``.
+
+    ``target`` is the text following ``from``/``import`` (or a comma), e.g.
+    ``b" old_name.sub as alias"``. Only complete module names are replaced, so
+    ``old_name_extra`` is left alone.
+    """
+    name = target.lstrip()
+    rest = name[len(old_name) :]
+    if not name.startswith(old_name) or rest[:1].isalnum() or rest[:1] == b"_":
+        return target
+    return target[: len(target) - len(name)] + new_name + rest
+
+
+@functools.lru_cache(maxsize=16)
+def _import_line_pattern(old_name: bytes) -> re.Pattern[bytes]:
+    """Compile a pattern matching ``import``/``from`` statements that mention ``old_name``.
+
+    A statement starts a line or follows a ``;`` (``import os; import x``) or
+    ``:`` (``try: import x``) and runs to the end of the line or the next ``;``.
+    """
+    return re.compile(
+        rb"(?:^|(?<=[;:]))[ \t]*(?:from|import)[ \t][^\n;]*" + re.escape(old_name) + rb"[^\n;]*",
+        re.MULTILINE,
+    )
+
+
+def _rewrite_import_line(line: bytes, old_name: bytes, new_name: bytes) -> bytes:
+    """Rename ``old_name`` in the module positions of one import statement."""
+    stripped = line.lstrip()
+    indent = line[: len(line) - len(stripped)]
+
+    if stripped.startswith(b"from"):
+        return indent + b"from" + _rename_module_prefix(stripped[4:], old_name, new_name)
+
+    # Leave trailing comments alone so commas in them aren't treated as targets
+    code, sep, comment = stripped[6:].partition(b"#")
+    targets = [_rename_module_prefix(t, old_name, new_name) for t in code.split(b",")]
+    return indent + b"import" + b",".join(targets) + sep + comment
 
 
-def _update_python_imports(content: bytes, old_name: str, new_name: str) -> bytes:
+def _update_python_imports(content: bytes, old_name: bytes, new_name: bytes) -> bytes:
     """Update Python file imports that reference the old package name.
 
-    This handles common patterns like:
+    Works on the raw bytes, only touching ``import`` and ``from`` statements
+    mentioning the old name, whether they start a line or follow a ``;`` or
+    ``:``. This handles common patterns like:
     - from old_name import ...
-    - import old_name
     - from old_name.submodule import ...
+    - import old_name
+    - import old_name as alias, other
+    - try: import old_name
+    - import os; import old_name
     """
-    text = content.decode("utf-8")
+    # Most modules never mention the top-level name; skip scanning those
+    if old_name not in content:
+        return content
+
+    # The regex finds candidate lines in C; only those are rewritten in Python
+    return _import_line_pattern(old_name).sub(
+        lambda match: _rewrite_import_line(match.group(), old_name, new_name), content
+    )
+
+
+def make_temp_file(directory: Path, suffix: str = ".tmp") -> tuple[int, str]:
+    """Create a new file in ``directory`` and open it for writing.
+
+    Like ``tempfile.mkstemp``, but the file gets the mode a plain ``open()``
+    would give it (0666 less the umask) rather than 0600, so it can be moved
+    into place as-is and stays readable by other users.
+    """
+    for _ in range(tempfile.TMP_MAX):
+        name = str(directory / f"tmp{secrets.token_hex(8)}{suffix}")
+        try:
+            return os.open(name, _TEMP_FILE_FLAGS, 0o666), name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name found in {directory}")
+
 
-    # Pattern to match imports (be careful not to replace partial matches)
-    # Only replace if old_name is a complete module name (word boundary)
-    patterns = [
-        (rf"\bfrom {re.escape(old_name)}(\s|\.)", rf"from {new_name}\1"),
-        (rf"\bimport {re.escape(old_name)}\b", f"import {new_name}"),
-    ]
+def _copy_entry(
+    src: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dst: zipfile.ZipFile,
+    new_info: zipfile.ZipInfo,
+) -> tuple[str, int]:
+    """Copy an entry unchanged in chunks, returning its RECORD hash and size."""
+    with src.open(info) as fin, dst.open(new_info, "w") as fout:
 
-    for pattern, replacement in patterns:
-        text = re.sub(pattern, replacement, text)
+        def chunks() -> Iterable[bytes]:
+            while chunk := fin.read(_COPY_CHUNK_SIZE):
+                fout.write(chunk)
+                yield chunk
 
-    return text.encode("utf-8")
+        return _compute_record_hash_streaming(chunks())
+
+
+def _zipfile_internals_available() -> bool:
+    """Check the zipfile internals used by ``_copy_entry_raw`` still exist.
+
+    They are undocumented, so a future Python could change them; entries are
+    then recompressed through the public API instead.
+    """
+    with zipfile.ZipFile(io.BytesIO(), "w") as zf:
+        attrs_present = all(
+            hasattr(zf, attr) for attr in ("fp", "start_dir", "filelist", "NameToInfo")
+        )
+    return (
+        attrs_present
+        and _LOCAL_FILE_HEADER.size == 30
+        and _LOCAL_FILE_HEADER_MAGIC == b"PK\x03\x04"
+        and hasattr(zipfile.ZipInfo, "FileHeader")
+    )
+
+
+_RAW_COPY_SUPPORTED = _zipfile_internals_available()
+
+
+def _archive_file(zf: zipfile.ZipFile) -> IO[bytes]:
+    """Get the file underlying an open archive."""
+    assert zf.fp is not None, "archive is closed"
+    return zf.fp
+
+
+def _set_compress_level(info: zipfile.ZipInfo, level: int | None) -> None:
+    """Set the compression level ``ZipFile.writestr`` uses for an entry."""
+    if sys.version_info >= (3, 13):
+        info.compress_level = level
+    else:
+        info._compresslevel = level  # pyright: ignore[reportAttributeAccessIssue] - private before 3.13
+
+
+def _can_copy_raw(info: zipfile.ZipInfo) -> bool:
+    """Check whether an entry's compressed bytes can be copied verbatim."""
+    return (
+        _RAW_COPY_SUPPORTED
+        and info.compress_type in _RAW_COPY_TYPES
+        and not info.flag_bits & _FLAG_ENCRYPTED
+    )
+
+
+def _read_record_hashes(src: zipfile.ZipFile, record_name: str) -> dict[str, tuple[str, int]]:
+    """Read the sha256 hashes and sizes listed in a wheel's RECORD file.
+
+    Returns an empty dict if the wheel has no RECORD at ``record_name`` or it
+    can't be parsed. The hashes only save work, so every entry is then hashed
+    from its content instead of failing the rename.
+    """
+    try:
+        content = src.read(record_name)
+    except KeyError:
+        return {}
+
+    hashes: dict[str, tuple[str, int]] = {}
+    try:
+        for row in csv.reader(content.decode("utf-8").splitlines()):
+            if len(row) == 3 and row[1].startswith("sha256=") and row[2].isdigit():
+                hashes[row[0]] = (row[1], int(row[2]))
+    except (UnicodeDecodeError, csv.Error, ValueError):
+        return {}
+    return hashes
+
+
+def _copy_entry_raw(
+    src: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dst: zipfile.ZipFile,
+    new_info: zipfile.ZipInfo,
+    record_hash: str | None = None,
+) -> tuple[str, int]:
+    """Copy an entry's compressed data verbatim, returning its RECORD hash and size.
+
+    The data is never recompressed. If ``record_hash`` (the entry's hash from
+    the source RECORD) is given, it is not inflated at all; otherwise it is
+    inflated only to compute the hash and check the CRC. zipfile has no public
+    API for writing pre-compressed data, so this writes the local header itself
+    and registers the entry the same way ``ZipFile.open(..., "w")`` does on close.
+    """
+    src_fp = _archive_file(src)
+    dst_fp = _archive_file(dst)
+
+    # Skip past the local file header to the start of the compressed data
+    src_fp.seek(info.header_offset)
+    header = _LOCAL_FILE_HEADER.unpack(src_fp.read(_LOCAL_FILE_HEADER.size))
+    if header[0] != _LOCAL_FILE_HEADER_MAGIC:
+        raise zipfile.BadZipFile(f"Bad magic number for file header: {info.filename!r}")
+    src_fp.seek(header[-2] + header[-1], 1)  # filename and extra field lengths
+
+    new_info.compress_type = info.compress_type
+    new_info.CRC = info.CRC
+    new_info.compress_size = info.compress_size
+    new_info.file_size = info.file_size
+    # Sizes and CRC are known up front, so no data descriptor follows the data
+    new_info.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+
+    dst_fp.seek(dst.start_dir)
+    new_info.header_offset = dst_fp.tell()
+    dst_fp.write(new_info.FileHeader())
+
+    def raw_chunks() -> Iterable[bytes]:
+        remaining = info.compress_size
+        while remaining > 0:
+            raw = src_fp.read(min(remaining, _COPY_CHUNK_SIZE))
+            if not raw:
+                raise zipfile.BadZipFile(f"Truncated data for file {info.filename!r}")
+            remaining -= len(raw)
+            yield raw
+
+    if record_hash is not None:
+        for raw in raw_chunks():
+            dst_fp.write(raw)
+        result = record_hash, info.file_size
+    else:
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        crc = 0
+
+        def chunks() -> Iterable[bytes]:
+            nonlocal crc
+            for raw in raw_chunks():
+                dst_fp.write(raw)
+                data = (
+                    inflater.decompress(raw) if info.compress_type == zipfile.ZIP_DEFLATED else raw
+                )
+                crc = zlib.crc32(data, crc)
+                yield data
+            if info.compress_type == zipfile.ZIP_DEFLATED:
+                data = inflater.flush()
+                crc = zlib.crc32(data, crc)
+                yield data
+
+        result = _compute_record_hash_streaming(chunks())
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+    dst.filelist.append(new_info)
+    dst.NameToInfo[new_info.filename] = new_info
+    dst.start_dir = dst_fp.tell()
+    return result
+
+
+def _rewrite_wheel(
+    src: zipfile.ZipFile,
+    dst: zipfile.ZipFile,
+    old_name_normalized: str,
+    new_name: str,
+    version: str,
+    *,
+    update_imports: bool,
+) -> None:
+    """Copy every entry of ``src`` into ``dst`` under the new package name.
+
+    Entries are renamed, rewritten, hashed, and written in a single pass. Only
+    METADATA and rewritten Python files are held in memory and recompressed;
+    all other entries have their compressed bytes copied through in chunks,
+    reusing their hash from the old RECORD when it lists one. The RECORD file
+    is regenerated from the collected hashes and written last.
+    """
+    new_name_normalized = _normalize_name(new_name)
+
+    # Old and new dist-info directory names
+    old_dist_info = f"{old_name_normalized}-{version}.dist-info"
+    new_dist_info = f"{new_name_normalized}-{version}.dist-info"
+
+    # Old and new data directory names (if present)
+    old_data_dir = f"{old_name_normalized}-{version}.data"
+    new_data_dir = f"{new_name_normalized}-{version}.data"
+
+    # Package, dist-info and data directory prefixes to rename
+    prefixes = (
+        (f"{old_name_normalized}/", f"{new_name_normalized}/"),
+        (f"{old_dist_info}/", f"{new_dist_info}/"),
+        (f"{old_data_dir}/", f"{new_data_dir}/"),
+    )
+    old_prefixes = tuple(old_prefix for old_prefix, _ in prefixes)
+
+    metadata_path = f"{new_dist_info}/METADATA"
+    record_path = f"{new_dist_info}/RECORD"
+    record_lines: list[str] = []
+
+    old_name_bytes = old_name_normalized.encode("utf-8")
+    new_name_bytes = new_name_normalized.encode("utf-8")
+
+    # Hashes of unchanged entries are taken from the existing RECORD
+    record_hashes = _read_record_hashes(src, f"{old_dist_info}/RECORD")
+
+    for info in src.infolist():
+        name = info.filename
+
+        # Skip the old RECORD file (we'll generate a new one)
+        if name.endswith("/RECORD"):
+            continue
+
+        new_file_name = name
+        if name.startswith(old_prefixes):
+            for old_prefix, new_prefix in prefixes:
+                if name.startswith(old_prefix):
+                    new_file_name = new_prefix + name[len(old_prefix) :]
+                    break
+
+        # Keep the original timestamp and permissions under the new name
+        new_info = zipfile.ZipInfo(new_file_name, date_time=info.date_time)
+        new_info.external_attr = info.external_attr
+        new_info.compress_type = dst.compression
+        _set_compress_level(new_info, dst.compresslevel)
+        new_info.file_size = info.file_size
+
+        new_content: bytes | None = None
+
+        # Update METADATA file
+        if new_file_name == metadata_path:
+            new_content = _update_metadata(src.read(info), old_name_normalized, new_name)
+
+        # Update Python files (imports), keeping the original entry if nothing changed
+        elif update_imports and new_file_name.endswith(".py"):
+            content = src.read(info)
+            rewritten = _update_python_imports(content, old_name_bytes, new_name_bytes)
+            if rewritten is not content:
+                new_content = rewritten
+
+        if new_content is not None:
+            dst.writestr(new_info, new_content)
+            file_hash, file_size = _compute_record_hash(new_content), len(new_content)
+
+        # Unchanged entries keep their compressed bytes; only renamed in the zip
+        elif _can_copy_raw(info):
+            recorded = record_hashes.get(name)
+            record_hash = recorded[0] if recorded and recorded[1] == info.file_size else None
+            file_hash, file_size = _copy_entry_raw(src, info, dst, new_info, record_hash)
+
+        else:
+            file_hash, file_size = _copy_entry(src, info, dst, new_info)
+
+        record_lines.append(f"{new_file_name},{file_hash},{file_size}")
+
+    # RECORD lists entries in archive order; RECORD itself has no hash
+    record_lines.append(f"{record_path},,")
+    record_content = "\n".join(record_lines).encode("utf-8")
+    dst.writestr(record_path, record_content)
 
 
 def rename_wheel(
@@ -154,70 +508,99 @@ def rename_wheel(
     new_wheel_name = _build_wheel_filename(components)
     output_path = output_dir / new_wheel_name
 
-    # Process the wheel
-    # Collect all files with their new names and contents
-    files: dict[str, bytes] = {}
-
-    # Old and new dist-info directory names
-    old_dist_info = f"{old_name_normalized}-{components['version']}.dist-info"
-    new_dist_info = f"{new_name_normalized}-{components['version']}.dist-info"
+    # Stream entries straight from the input wheel into a temporary file next to
+    # the output, moving it into place only once complete so a failed rename
+    # never leaves a truncated wheel under the final name
+    fd, tmp_name = make_temp_file(output_dir)
+    try:
+        with (
+            zipfile.ZipFile(wheel_path, "r") as src,
+            os.fdopen(fd, "wb") as f,
+            zipfile.ZipFile(
+                f, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=_COMPRESS_LEVEL
+            ) as dst,
+        ):
+            _rewrite_wheel(
+                src,
+                dst,
+                old_name_normalized,
+                new_name,
+                components["version"],
+                update_imports=update_imports,
+            )
+        Path(tmp_name).replace(output_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
-    # Old and new data directory names (if present)
-    old_data_dir = f"{old_name_normalized}-{components['version']}.data"
-    new_data_dir = f"{new_name_normalized}-{components['version']}.data"
-
-    for name, content in _iter_wheel_files(wheel_path):
-        new_file_name = name
-
-        # Rename the package directory
-        if name.startswith(f"{old_name_normalized}/") or name == old_name_normalized:
-            new_file_name = new_name_normalized + name[len(old_name_normalized) :]
-
-        # Rename the dist-info directory
-        elif name.startswith(f"{old_dist_info}/") or name == old_dist_info:
-            new_file_name = new_dist_info + name[len(old_dist_info) :]
-
-        # Rename the data directory (if present)
-        elif name.startswith(f"{old_data_dir}/") or name == old_data_dir:
-            new_file_name = new_data_dir + name[len(old_data_dir) :]
+    return output_path
 
-        # Update file contents as needed
-        new_content = content
 
-        # Update METADATA file
-        if new_file_name == f"{new_dist_info}/METADATA":
-            new_content = _update_metadata(content, old_name, new_name)
+def _dist_info_name_version(zf: zipfile.ZipFile) -> tuple[str, str]:
+    """Get the normalized distribution name and version from a wheel's dist-info."""
+    dist_info_dirs = [n for n in zf.namelist() if ".dist-info/" in n]
+    if not dist_info_dirs:
+        msg = "Cannot find .dist-info directory in wheel"
+        raise ValueError(msg)
 
-        # Update Python files (imports)
-        elif update_imports and new_file_name.endswith(".py"):
-            new_content = _update_python_imports(content, old_name_normalized, new_name_normalized)
+    # e.g., "icechunk-1.0.0.dist-info"
+    dist_info_name = dist_info_dirs[0].split("/")[0]
+    parts = dist_info_name.removesuffix(".dist-info").rsplit("-", 1)
+    return parts[0], parts[1] if len(parts) > 1 else "0.0.0"
 
-        # Skip the old RECORD file (we'll generate a new one)
-        if name.endswith("/RECORD"):
-            continue
 
-        files[new_file_name] = new_content
+def _rename_zip(
+    zf: zipfile.ZipFile,
+    dst: IO[bytes],
+    new_name: str,
+    *,
+    update_imports: bool,
+) -> bool:
+    """Write a renamed copy of an open wheel to ``dst``.
 
-    # Generate new RECORD file
-    record_path = f"{new_dist_info}/RECORD"
-    record_lines: list[str] = []
+    Returns:
+        False without writing anything if the wheel already has the new name
+    """
+    old_name_normalized, version = _dist_info_name_version(zf)
+    if old_name_normalized == _normalize_name(new_name):
+        return False
+
+    with zipfile.ZipFile(
+        dst, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=_COMPRESS_LEVEL
+    ) as out:
+        _rewrite_wheel(
+            zf,
+            out,
+            old_name_normalized,
+            new_name,
+            version,
+            update_imports=update_imports,
+        )
+    return True
 
-    for file_name, content in sorted(files.items()):
-        file_hash = _compute_record_hash(content)
-        file_size = len(content)
-        record_lines.append(f"{file_name},{file_hash},{file_size}")
 
-    # RECORD itself has no hash
-    record_lines.append(f"{record_path},,")
-    record_content = "\n".join(record_lines).encode("utf-8")
-    files[record_path] = record_content
+def rename_wheel_from_stream(
+    src: IO[bytes],
+    dst: IO[bytes],
+    new_name: str,
+    *,
+    update_imports: bool = True,
+) -> None:
+    """Rename a wheel read from one seekable binary file into another.
 
-    # Write the new wheel
-    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_name, content in sorted(files.items()):
-            zf.writestr(file_name, content)
+    Args:
+        src: Original wheel file contents
+        dst: File to write the renamed wheel to
+        new_name: New package name (e.g., "icechunk_v1")
+        update_imports: Whether to update import statements in Python files
+    """
+    with zipfile.ZipFile(src, "r") as zf:
+        renamed = _rename_zip(zf, dst, new_name, update_imports=update_imports)
 
-    return output_path
+    if not renamed:
+        # Already has the new name (e.g. renamed before); copy it through as-is
+        src.seek(0)
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
 
 
 def rename_wheel_from_bytes(
@@ -236,101 +619,11 @@ def rename_wheel_from_bytes(
     Returns:
         Renamed wheel file contents as bytes
     """
-    from io import BytesIO
-
-    # Read the wheel from bytes
-    input_buffer = BytesIO(wheel_bytes)
-
-    with zipfile.ZipFile(input_buffer, "r") as zf:
-        # Find the distribution name from the wheel
-        dist_info_dirs = [n for n in zf.namelist() if ".dist-info/" in n]
-        if not dist_info_dirs:
-            msg = "Cannot find .dist-info directory in wheel"
-            raise ValueError(msg)
-
-        # Extract version from dist-info directory name
-        dist_info_name = dist_info_dirs[0].split("/")[0]  # e.g., "icechunk-1.0.0.dist-info"
-        old_name_normalized, version = (
-            dist_info_name.rsplit("-", 1)[0],
-            dist_info_name.rsplit("-", 1)[1].replace(".dist-info", ""),
-        )
-
-        # Re-extract version properly
-        parts = dist_info_name.replace(".dist-info", "").rsplit("-", 1)
-        old_name_normalized = parts[0]
-        version = parts[1] if len(parts) > 1 else "0.0.0"
-
-        new_name_normalized = _normalize_name(new_name)
-
-        if old_name_normalized == new_name_normalized:
+    output_buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(wheel_bytes), "r") as zf:
+        if not _rename_zip(zf, output_buffer, new_name, update_imports=update_imports):
             return wheel_bytes  # No rename needed
 
-        # Old and new dist-info directory names
-        old_dist_info = f"{old_name_normalized}-{version}.dist-info"
-        new_dist_info = f"{new_name_normalized}-{version}.dist-info"
-
-        # Old and new data directory names (if present)
-        old_data_dir = f"{old_name_normalized}-{version}.data"
-        new_data_dir = f"{new_name_normalized}-{version}.data"
-
-        # Process files
-        files: dict[str, bytes] = {}
-
-        for name in zf.namelist():
-            content = zf.read(name)
-            new_file_name = name
-
-            # Rename the package directory
-            if name.startswith(f"{old_name_normalized}/") or name == old_name_normalized:
-                new_file_name = new_name_normalized + name[len(old_name_normalized) :]
-
-            # Rename the dist-info directory
-            elif name.startswith(f"{old_dist_info}/") or name == old_dist_info:
-                new_file_name = new_dist_info + name[len(old_dist_info) :]
-
-            # Rename the data directory (if present)
-            elif name.startswith(f"{old_data_dir}/") or name == old_data_dir:
-                new_file_name = new_data_dir + name[len(old_data_dir) :]
-
-            # Update file contents as needed
-            new_content = content
-
-            # Update METADATA file
-            if new_file_name == f"{new_dist_info}/METADATA":
-                new_content = _update_metadata(content, old_name_normalized, new_name)
-
-            # Update Python files (imports)
-            elif update_imports and new_file_name.endswith(".py"):
-                new_content = _update_python_imports(
-                    content, old_name_normalized, new_name_normalized
-                )
-
-            # Skip the old RECORD file (we'll generate a new one)
-            if name.endswith("/RECORD"):
-                continue
-
-            files[new_file_name] = new_content
-
-    # Generate new RECORD file
-    record_path = f"{new_dist_info}/RECORD"
-    record_lines: list[str] = []
-
-    for file_name, content in sorted(files.items()):
-        file_hash = _compute_record_hash(content)
-        file_size = len(content)
-        record_lines.append(f"{file_name},{file_hash},{file_size}")
-
-    # RECORD itself has no hash
-    record_lines.append(f"{record_path},,")
-    record_content = "\n".join(record_lines).encode("utf-8")
-    files[record_path] = record_content
-
-    # Write the new wheel to bytes
-    output_buffer = BytesIO()
-    with zipfile.ZipFile(output_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_name, content in sorted(files.items()):
-            zf.writestr(file_name, content)
-
     return output_buffer.getvalue()
 
 
@@ -357,28 +650,26 @@ def inspect_wheel(wheel_path: Path) -> dict[str, object]:
         "has_underscore_prefix_extension": False,
     }
 
-    files_list: list[str] = []
     extensions_list: list[dict[str, str]] = []
 
     with zipfile.ZipFile(wheel_path, "r") as zf:
-        for name in zf.namelist():
-            files_list.append(name)
-
-            # Check for compiled extensions
-            if any(name.endswith(ext) for ext in (".so", ".pyd", ".dylib")):
-                ext_name = Path(name).stem.split(".")[
-                    0
-                ]  # e.g., _icechunk from _icechunk.cpython-311-darwin
-                has_underscore = ext_name.startswith("_")
-                extensions_list.append(
-                    {
-                        "path": name,
-                        "module_name": ext_name,
-                        "has_underscore_prefix": str(has_underscore),
-                    }
-                )
-                if has_underscore:
-                    info["has_underscore_prefix_extension"] = True
+        files_list = zf.namelist()
+
+    for name in files_list:
+        # Check for compiled extensions
+        if name.endswith((".so", ".pyd", ".dylib")):
+            # e.g., _icechunk from _icechunk.cpython-311-darwin.so
+            ext_name = name.rpartition("/")[2].split(".", 1)[0]
+            has_underscore = ext_name.startswith("_")
+            extensions_list.append(
+                {
+                    "path": name,
+                    "module_name": ext_name,
+                    "has_underscore_prefix": str(has_underscore),
+                }
+            )
+            if has_underscore:
+                info["has_underscore_prefix_extension"] = True
 
     info["files"] = files_list
     info["extensions"] = extensions_list
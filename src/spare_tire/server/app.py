@@ -6,11 +6,17 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse
+from starlette.background import BackgroundTask
 
 from spare_tire.server.config import ProxyConfig  # noqa: TC001 - used at runtime
 from spare_tire.server.html import generate_project_index, generate_root_index
-from spare_tire.server.stream import original_filename_from_renamed, stream_and_rename_wheel
+from spare_tire.server.stream import (
+    original_filename_from_renamed,
+    renamed_wheel_cache_path,
+    stream_and_rename_wheel,
+    use_cached_wheel,
+)
 from spare_tire.server.upstream import UpstreamClient
 
 if TYPE_CHECKING:
@@ -54,6 +60,9 @@ def create_app(config: ProxyConfig) -> FastAPI:
         """Redirect root to /simple/."""
         return RedirectResponse(url="/simple/")
 
+    # Virtual packages only change with the config, so render the root index once
+    root_index_html = generate_root_index(config.get_virtual_packages()).encode("utf-8")
+
     @app.get("/simple/")
     async def simple_index() -> Response:
         """List all available projects.
@@ -62,15 +71,10 @@ def create_app(config: ProxyConfig) -> FastAPI:
         - All projects from upstream indexes
         - Virtual packages from rename rules (e.g., icechunk_v1)
         """
-        # Start with virtual packages from rename rules
-        projects = set(config.get_virtual_packages())
-
         # For a full proxy, we'd also fetch all projects from upstream
         # But that's expensive, so we only list our virtual packages
         # Real packages are fetched on-demand when their project page is requested
-
-        html = generate_root_index(sorted(projects))
-        return Response(content=html, media_type="text/html")
+        return Response(content=root_index_html, media_type="text/html")
 
     @app.get("/simple/{project}/")
     async def project_index(project: str) -> Response:
@@ -138,40 +142,48 @@ def create_app(config: ProxyConfig) -> FastAPI:
                 filename, rename_rule.original, rename_rule.new_name
             )
 
-            # Fetch packages to find the URL
-            packages = await client.get_project_page(rename_rule.original, rename_rule)
-
-            # Find the package URL
-            upstream_url = client.find_package_url(packages, original_filename)
+            # Find the package on the upstream project page
+            pkg = await client.get_package(rename_rule.original, original_filename, rename_rule)
 
-            if not upstream_url:
+            if pkg is None or not pkg["url"]:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Package not found: {original_filename}",
                 )
 
-            # Download and rename
-            renamed_bytes = await stream_and_rename_wheel(
-                client, upstream_url, rename_rule.new_name
+            upstream_url = pkg["url"]
+
+            # Serve a previously renamed copy; only cache wheels with a known
+            # upstream hash so re-uploaded files are never served stale
+            upstream_hash = pkg["hash"]
+            cache_path = (
+                renamed_wheel_cache_path(
+                    config.cache_dir, upstream_url, upstream_hash, rename_rule.new_name
+                )
+                if upstream_hash and config.cache_dir is not None
+                else None
             )
+            if cache_path is not None and use_cached_wheel(cache_path):
+                return FileResponse(
+                    cache_path, media_type="application/octet-stream", filename=filename
+                )
 
-            return Response(
-                content=renamed_bytes,
+            # Download and rename into the cache, or into a temporary file that
+            # is removed once the response has been sent
+            dest, is_temporary = await stream_and_rename_wheel(
+                client, upstream_url, rename_rule.new_name, cache_path, config.cache_max_size
+            )
+
+            return FileResponse(
+                dest,
                 media_type="application/octet-stream",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"',
-                },
+                filename=filename,
+                background=BackgroundTask(dest.unlink, missing_ok=True) if is_temporary else None,
             )
         else:
             # Passthrough - find upstream URL and redirect
-            packages = await client.get_project_page(project)
-
-            # Find the package
-            upstream_url = None
-            for pkg in packages:
-                if pkg["filename"] == filename:
-                    upstream_url = pkg["url"]
-                    break
+            pkg = await client.get_package(project, filename)
+            upstream_url = pkg["url"] if pkg else None
 
             if not upstream_url:
                 raise HTTPException(
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import tomllib
-from dataclasses import dataclass, field
-from pathlib import Path  # noqa: TC003 - used at runtime
+from dataclasses import dataclass, field, replace
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from spare_tire.server.stream import DEFAULT_CACHE_MAX_SIZE, default_cache_dir
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_name(name: str) -> str:
     """Normalize a package name according to PEP 503."""
-    return re.sub(r"[-_.]+", "-", name).lower()
+    return _NORMALIZE_RE.sub("-", name).lower()
 
 
-@dataclass
+@dataclass(frozen=True)
 class RenameRule:
     """A rule for renaming a package."""
 
@@ -44,19 +51,35 @@ class ProxyConfig:
     upstreams: list[str] = field(default_factory=list)
     """Upstream index URLs in priority order."""
 
+    cache_dir: Path | None = field(default_factory=default_cache_dir)
+    """Directory renamed wheels are cached in, or None to not cache them."""
+
+    cache_max_size: int = DEFAULT_CACHE_MAX_SIZE
+    """Most bytes of renamed wheels kept in ``cache_dir``; least recently used go first."""
+
     renames: list[RenameRule] = field(default_factory=list)
-    """Package rename rules."""
+    """Package rename rules.
+
+    Fixed once the config is created: rule lookups use an index built from them
+    at construction.
+    """
+
+    _rule_index: dict[str, RenameRule] = field(
+        default_factory=dict[str, RenameRule], init=False, repr=False, compare=False
+    )
+    """Rename rules keyed by normalized virtual package name."""
+
+    def __post_init__(self) -> None:
+        for rule in self.renames:
+            # The first matching rule wins, as it did with a linear scan
+            self._rule_index.setdefault(_normalize_name(rule.new_name), rule)
 
     def get_rename_rule(self, new_name: str) -> RenameRule | None:
         """Get the rename rule for a virtual package name.
 
         Handles PEP 503 name normalization (icechunk_v1 == icechunk-v1).
         """
-        normalized = _normalize_name(new_name)
-        for rule in self.renames:
-            if _normalize_name(rule.new_name) == normalized:
-                return rule
-        return None
+        return self._rule_index.get(_normalize_name(new_name))
 
     def get_original_for_renamed(self, new_name: str) -> str | None:
         """Get the original package name for a renamed package."""
@@ -107,6 +130,9 @@ def load_config(
     renames: Sequence[str] | None = None,
     host: str | None = None,
     port: int | None = None,
+    cache_dir: Path | None = None,
+    cache_max_size_mb: int | None = None,
+    no_cache: bool = False,
 ) -> ProxyConfig:
     """Load configuration from file and CLI overrides.
 
@@ -116,11 +142,16 @@ def load_config(
         renames: CLI rename rules as 'original=new_name:version' strings
         host: CLI host override
         port: CLI port override
+        cache_dir: CLI renamed wheel cache directory override
+        cache_max_size_mb: CLI renamed wheel cache size limit override, in MiB
+        no_cache: Disable the renamed wheel cache
 
     Returns:
         ProxyConfig with merged settings
     """
     config = ProxyConfig()
+    # Rules are collected first, since the config indexes them when created
+    rename_rules: list[RenameRule] = []
 
     # Load from config file if provided
     if config_path is not None:
@@ -130,6 +161,12 @@ def load_config(
         proxy_section = data.get("proxy", {})
         config.host = proxy_section.get("host", config.host)
         config.port = proxy_section.get("port", config.port)
+        if "cache_dir" in proxy_section:
+            config.cache_dir = Path(proxy_section["cache_dir"]).expanduser()
+        if "cache_max_size_mb" in proxy_section:
+            config.cache_max_size = proxy_section["cache_max_size_mb"] * 1024**2
+        if proxy_section.get("cache") is False:
+            config.cache_dir = None
 
         # Load upstreams
         for upstream in proxy_section.get("upstreams", []):
@@ -142,7 +179,7 @@ def load_config(
         renames_section = data.get("renames", {})
         for original, rename_config in renames_section.items():
             if isinstance(rename_config, dict):
-                config.renames.append(
+                rename_rules.append(
                     RenameRule(
                         original=original,
                         new_name=rename_config["name"],
@@ -151,14 +188,14 @@ def load_config(
                 )
             else:
                 # Simple format: original = "new_name"
-                config.renames.append(RenameRule(original=original, new_name=rename_config))
+                rename_rules.append(RenameRule(original=original, new_name=rename_config))
 
     # Apply CLI overrides
     if upstreams:
         config.upstreams = list(upstreams)
 
     if renames:
-        config.renames = [parse_rename_arg(r) for r in renames]
+        rename_rules = [parse_rename_arg(r) for r in renames]
 
     if host is not None:
         config.host = host
@@ -166,4 +203,13 @@ def load_config(
     if port is not None:
         config.port = port
 
-    return config
+    if cache_dir is not None:
+        config.cache_dir = cache_dir
+
+    if cache_max_size_mb is not None:
+        config.cache_max_size = cache_max_size_mb * 1024**2
+
+    if no_cache:
+        config.cache_dir = None
+
+    return replace(config, renames=rename_rules)
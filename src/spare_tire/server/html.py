@@ -48,7 +48,7 @@ def generate_project_index(
     Returns:
         PEP 503 compliant HTML
     """
-    links = []
+    links: list[str] = []
     for pkg in packages:
         filename = pkg["filename"]
         url = pkg.get("url", filename)
@@ -61,18 +61,17 @@ def generate_project_index(
             # URL points to ourselves for download (we'll rename on-the-fly)
             url = filename
 
-        # Build anchor attributes
-        attrs = [f'href="{url}"']
-
-        if pkg.get("requires_python"):
-            attrs.append(f'data-requires-python="{pkg["requires_python"]}"')
-
+        # Hash goes in the URL fragment, unless the URL already has one
         if pkg.get("hash") and "#" not in url:
-            # Append hash as fragment
-            attrs[0] = f'href="{url}#{pkg["hash"]}"'
-
-        link = f"    <a {' '.join(attrs)}>{filename}</a>"
-        links.append(link)
+            url = f"{url}#{pkg['hash']}"
+
+        requires_python = pkg.get("requires_python")
+        if requires_python:
+            links.append(
+                f'    <a href="{url}" data-requires-python="{requires_python}">{filename}</a>'
+            )
+        else:
+            links.append(f'    <a href="{url}">{filename}</a>')
 
     links_html = "\n".join(links)
     return f"""<!DOCTYPE html>
@@ -2,54 +2,194 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import os
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from spare_tire import __version__
+
 if TYPE_CHECKING:
+    from typing import IO
+
     from spare_tire.server.upstream import UpstreamClient
 
 
-async def rename_wheel_bytes(
-    wheel_bytes: bytes,
+# Downloaded wheels larger than this are spooled to disk instead of memory
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Bump whenever the renamed output changes without a spare-tire version bump,
+# so wheels cached by the older rename logic are not served
+_RENAMED_CACHE_FORMAT = 1
+
+# Default bound on the renamed wheel cache, in bytes
+DEFAULT_CACHE_MAX_SIZE = 2 * 1024**3
+
+
+def _rename_to_file(wheel_file: IO[bytes], new_name: str, dest: Path) -> None:
+    """Rename a wheel to ``dest`` via a temporary file in the same directory."""
+    from spare_tire.rename import make_temp_file, rename_wheel_from_stream
+
+    fd, tmp_name = make_temp_file(dest.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            rename_wheel_from_stream(wheel_file, f, new_name)
+        Path(tmp_name).replace(dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+async def rename_wheel_to_file(
+    wheel_file: IO[bytes],
     new_name: str,
-) -> bytes:
-    """Rename a wheel from bytes.
+    dest: Path,
+) -> None:
+    """Rename a wheel read from a seekable file, writing the result to a file.
+
+    The renamed wheel is written next to ``dest`` and moved into place once
+    complete, so a partially written wheel is never visible at ``dest``. The
+    rename runs in a worker thread so the event loop keeps serving other
+    requests in the meantime.
 
     Args:
-        wheel_bytes: Original wheel bytes
+        wheel_file: Original wheel contents
         new_name: New package name
-
-    Returns:
-        Renamed wheel bytes
+        dest: Path to write the renamed wheel to
     """
-    from spare_tire.rename import rename_wheel_from_bytes
-
-    return rename_wheel_from_bytes(wheel_bytes, new_name)
+    await asyncio.to_thread(_rename_to_file, wheel_file, new_name, dest)
 
 
 async def stream_and_rename_wheel(
     client: UpstreamClient,
     upstream_url: str,
     new_name: str,
-) -> bytes:
-    """Download wheel from upstream and rename it.
+    cache_path: Path | None,
+    cache_max_size: int | None = None,
+) -> tuple[Path, bool]:
+    """Download wheel from upstream and write the renamed wheel to disk.
+
+    The download is spooled into a temporary file that stays in memory for
+    small wheels and moves to disk for large ones, so a large wheel is never
+    held in memory as a whole.
 
-    This downloads the entire wheel into memory, renames it, and returns
-    the renamed bytes. For very large wheels, this could use significant
-    memory, but most wheels are <100MB which is acceptable.
+    The renamed wheel is written to ``cache_path`` if given. If the cache
+    can't be written (e.g. it is read-only or full), it is written to a new
+    temporary file instead, which the caller must remove once it has been
+    served. After a wheel is cached, the cache directory is pruned down to
+    ``cache_max_size`` bytes.
 
     Args:
         client: Upstream client to download from
         upstream_url: URL of the original wheel
         new_name: New package name
+        cache_path: Cache file to write the renamed wheel to, if any
+        cache_max_size: Most bytes to keep in the cache directory (unbounded if None)
 
     Returns:
-        Renamed wheel bytes
+        Tuple of (path, is_temporary)
+    """
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as wheel_file:
+        await client.download_wheel_to_file(upstream_url, wheel_file)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                wheel_file.seek(0)
+                await rename_wheel_to_file(wheel_file, new_name, cache_path)
+            except OSError:
+                pass  # No usable cache; fall back to a temporary file
+            else:
+                if cache_max_size is not None:
+                    await asyncio.to_thread(
+                        prune_wheel_cache, cache_path.parent, cache_max_size, cache_path
+                    )
+                return cache_path, False
+
+        fd, tmp_name = tempfile.mkstemp(prefix="spare-tire-", suffix=".whl")
+        os.close(fd)
+        dest = Path(tmp_name)
+        try:
+            wheel_file.seek(0)
+            await rename_wheel_to_file(wheel_file, new_name, dest)
+        except BaseException:
+            dest.unlink(missing_ok=True)
+            raise
+        return dest, True
+
+
+def default_cache_dir() -> Path:
+    """Get the default directory for cached renamed wheels.
+
+    ``$XDG_CACHE_HOME/spare-tire/renamed-v0/`` (default ``~/.cache``).
+    """
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "spare-tire" / "renamed-v0"
+
+
+def renamed_wheel_cache_path(
+    cache_dir: Path, upstream_url: str, upstream_hash: str, new_name: str
+) -> Path:
+    """Get the cache file for a renamed wheel.
+
+    The upstream hash is part of the key because nightly indexes re-upload
+    wheels under the same filename. The spare-tire version and
+    ``_RENAMED_CACHE_FORMAT`` are too, so wheels renamed by older code are
+    not served after the rename logic changes.
     """
-    # Download complete wheel
-    wheel_bytes = await client.download_wheel(upstream_url)
+    parts = (__version__, str(_RENAMED_CACHE_FORMAT), upstream_url, upstream_hash, new_name)
+    key = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return cache_dir / f"{key}.whl"
+
+
+def use_cached_wheel(path: Path) -> bool:
+    """Check whether a renamed wheel is cached, marking it as recently used."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return path.is_file()  # Read-only cache; still usable
+    return True
 
-    # Rename in memory
-    return await rename_wheel_bytes(wheel_bytes, new_name)
+
+def prune_wheel_cache(cache_dir: Path, max_size: int, keep: Path | None = None) -> None:
+    """Delete the least recently used renamed wheels until ``cache_dir`` fits in ``max_size``.
+
+    Cache hits refresh a wheel's modification time, so wheels cached by older
+    spare-tire versions, which are never hit again, are removed first. ``keep``
+    (the wheel about to be served) is never removed.
+    """
+    wheels: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".whl") and entry.is_file():
+                    stat = entry.stat()
+                    wheels.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in wheels)
+    for _, size, path in sorted(wheels):
+        if total <= max_size:
+            break
+        if keep is not None and path == str(keep):
+            continue
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError:
+            continue
+        total -= size
+
+
+@functools.lru_cache(maxsize=2048)
+def _canonical_name(name: str) -> str:
+    """Normalize a distribution name for comparison (cached)."""
+    return name.lower().replace("_", "-")
 
 
 def rewrite_wheel_filename(filename: str, original_name: str, new_name: str) -> str:
@@ -64,11 +204,11 @@ def rewrite_wheel_filename(filename: str, original_name: str, new_name: str) ->
         Rewritten filename
     """
     # Wheel filenames are: {distribution}-{version}(-{build})?-{python}-{abi}-{platform}.whl
-    # Replace the distribution (first part before first hyphen that's followed by a digit)
-    parts = filename.split("-")
-    if parts[0].lower().replace("_", "-") == original_name.lower().replace("_", "-"):
-        parts[0] = new_name
-    return "-".join(parts)
+    # The distribution is everything before the first hyphen
+    distribution, sep, rest = filename.partition("-")
+    if _canonical_name(distribution) == _canonical_name(original_name):
+        return new_name + sep + rest
+    return filename
 
 
 def original_filename_from_renamed(renamed_filename: str, original_name: str, new_name: str) -> str:
@@ -83,7 +223,4 @@ def original_filename_from_renamed(renamed_filename: str, original_name: str, ne
         Original filename
     """
     # Reverse of rewrite_wheel_filename
-    parts = renamed_filename.split("-")
-    if parts[0].lower().replace("_", "-") == new_name.lower().replace("_", "-"):
-        parts[0] = original_name
-    return "-".join(parts)
+    return rewrite_wheel_filename(renamed_filename, new_name, original_name)
@@ -2,17 +2,130 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import functools
+import importlib.util
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, TypeVar
 
 import httpx
 from packaging.specifiers import SpecifierSet
-from packaging.version import Version
+from packaging.version import InvalidVersion
+
+from spare_tire.download import parse_package_version
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
+    from typing import IO
+
+    from pypi_simple import DistributionPackage
 
     from spare_tire.server.config import ProxyConfig, RenameRule
 
+# Chunk size for writing downloaded wheels to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Connection pool shared by all proxy requests; resolvers fetch many project
+# pages and wheels concurrently from the same few upstream hosts
+_POOL_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# HTTP/2 lets concurrent page and wheel requests to one host share a single
+# connection; httpx only supports it when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Project pages are reused for this long unless upstream sends Cache-Control max-age
+_DEFAULT_PAGE_TTL = 60.0
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Most project pages (and filtered package lists) kept in memory; keys come from
+# client requests, so the least recently used entries are evicted to bound
+# memory in a long-running proxy
+_PAGE_CACHE_SIZE = 1024
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+# Ask for PEP 691 JSON project pages, which parse far faster than HTML; indexes
+# that only serve the HTML API still answer with text/html
+_PAGE_ACCEPT = "application/vnd.pypi.simple.v1+json, text/html;q=0.01"
+_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+
+# Digest algorithms advertised to clients, preferred first (most widely supported)
+_HASH_PRIORITY = ("sha256", "sha384", "sha512", "md5")
+
+
+def _best_hash(digests: dict[str, str]) -> str | None:
+    """Format the preferred digest as a ``{algo}={hex}`` URL fragment."""
+    # Nearly every index serves sha256, so check it before scanning the rest
+    if "sha256" in digests:
+        return f"sha256={digests['sha256']}"
+    for algo in _HASH_PRIORITY[1:]:
+        if algo in digests:
+            return f"{algo}={digests[algo]}"
+    return None
+
+
+def _lru_get(cache: OrderedDict[_K, _V], key: _K) -> _V | None:
+    """Get an entry from an LRU cache, marking it as most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict[_K, _V], key: _K, value: _V, max_size: int) -> None:
+    """Add an entry to an LRU cache, evicting the least recently used beyond ``max_size``."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _expires_at(response: httpx.Response) -> float:
+    """Get the monotonic time until which a project page response stays fresh."""
+    match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+    ttl = float(match.group(1)) if match else _DEFAULT_PAGE_TTL
+    return time.monotonic() + ttl
+
+
+@functools.lru_cache(maxsize=64)
+def _specifier_set(version_spec: str) -> SpecifierSet:
+    """Parse a rename rule's version specifier, allowing pre-releases (cached)."""
+    return SpecifierSet(version_spec, prereleases=True)
+
+
+@functools.lru_cache(maxsize=8192)
+def _version_matches(version_spec: str, version: str) -> bool:
+    """Check whether a version satisfies a version specifier (cached).
+
+    Project pages are re-filtered on every request with the same few rules, so
+    repeated (rule, version) pairs become a dict lookup. Unparseable versions
+    never match.
+    """
+    try:
+        return parse_package_version(version) in _specifier_set(version_spec)
+    except InvalidVersion:
+        return False
+
+
+def _parse_project_wheels(project: str, response: httpx.Response) -> list[DistributionPackage]:
+    """Parse the wheels from a project page served as PEP 691 JSON or HTML."""
+    from pypi_simple import ProjectPage
+
+    base_url = str(response.url)
+    if response.headers.get("content-type", "").startswith(_JSON_CONTENT_TYPE):
+        page = ProjectPage.from_json_data(json.loads(response.content), base_url)
+    else:
+        page = ProjectPage.from_html(project, response.text, base_url)
+    return [pkg for pkg in page.packages if pkg.package_type == "wheel"]
+
 
 class UpstreamClient:
     """Client for querying upstream package indexes."""
@@ -25,12 +138,32 @@ class UpstreamClient:
         """
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        # Page URL -> (expires_at, etag, wheels)
+        self._page_cache: OrderedDict[str, tuple[float, str | None, list[DistributionPackage]]] = (
+            OrderedDict()
+        )
+        # (project, version spec) -> (wheels, packages, packages by filename),
+        # reused for as long as the same parsed wheels list is being served
+        self._packages_cache: OrderedDict[
+            tuple[str, str | None],
+            tuple[
+                list[DistributionPackage],
+                list[dict[str, str | None]],
+                dict[str, dict[str, str | None]],
+            ],
+        ] = OrderedDict()
 
     async def __aenter__(self) -> UpstreamClient:
-        """Enter async context."""
+        """Enter async context.
+
+        The HTTP client lives for the whole context (the app's lifespan), so
+        connections to upstreams are pooled and reused across requests.
+        """
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(30.0),
             follow_redirects=True,
+            limits=_POOL_LIMITS,
+            http2=_HTTP2,
         )
         return self
 
@@ -62,108 +195,148 @@ class UpstreamClient:
         Returns:
             List of package dicts with filename, url, requires_python, hash
         """
-        from pypi_simple import ProjectPage
-
-        # Try each upstream in order
-        for upstream_url in self.config.upstreams:
-            url = f"{upstream_url.rstrip('/')}/{project}/"
-
-            try:
-                response = await self.client.get(url)
-                if response.status_code == 404:
-                    continue
-                response.raise_for_status()
-            except httpx.HTTPError:
-                continue
+        packages, _ = await self._get_project_packages(project, rename_rule)
+        return packages
+
+    async def get_package(
+        self,
+        project: str,
+        filename: str,
+        rename_rule: RenameRule | None = None,
+    ) -> dict[str, str | None] | None:
+        """Look up a single package on a project page by its upstream filename.
 
-            # Parse the HTML response
-            page = ProjectPage.from_html(project, response.text, upstream_url)
-            packages = []
+        Args:
+            project: Project name to look up
+            filename: The original (non-renamed) filename to find
+            rename_rule: If set, only packages matching its version constraint are found
 
+        Returns:
+            The matching package dict, or None if not found
+        """
+        _, by_filename = await self._get_project_packages(project, rename_rule)
+        return by_filename.get(filename)
+
+    async def _get_project_packages(
+        self,
+        project: str,
+        rename_rule: RenameRule | None,
+    ) -> tuple[list[dict[str, str | None]], dict[str, dict[str, str | None]]]:
+        """Get the filtered package dicts for a project and an index by filename."""
+        # Query every upstream at once, but still prefer them in priority order
+        tasks = [
+            asyncio.create_task(self._fetch_project_wheels(upstream_url, project))
+            for upstream_url in self.config.upstreams
+        ]
+        try:
+            for task in tasks:
+                wheels = await task
+                if wheels is not None:
+                    break
+            else:
+                # No upstream had the project
+                return [], {}
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Retrieve every outcome so lower-priority upstreams that already
+            # failed aren't logged as "Task exception was never retrieved"
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        version_spec = rename_rule.version_spec if rename_rule else None
+        key = (project, version_spec)
+        cached = _lru_get(self._packages_cache, key)
+        if cached is not None and cached[0] is wheels:
+            return cached[1], cached[2]
+
+        packages: list[dict[str, str | None]] = []
+        by_filename: dict[str, dict[str, str | None]] = {}
+        for pkg in wheels:
             # Filter by version if we have a rename rule with version spec
-            version_spec = None
-            if rename_rule and rename_rule.version_spec:
-                version_spec = SpecifierSet(rename_rule.version_spec, prereleases=True)
-
-            for pkg in page.packages:
-                # Only include wheels
-                if pkg.package_type != "wheel":
-                    continue
-
-                # Filter by version if specified
-                if version_spec and pkg.version:
-                    try:
-                        if Version(pkg.version) not in version_spec:
-                            continue
-                    except Exception:
-                        # Skip packages with unparseable versions
-                        continue
-
-                # Build package info dict
-                pkg_info: dict[str, str | None] = {
-                    "filename": pkg.filename,
-                    "url": pkg.url,
-                    "requires_python": pkg.requires_python,
-                    "hash": None,
-                }
-
-                # Extract hash if available
-                if pkg.digests:
-                    for algo in ("sha256", "sha384", "sha512", "md5"):
-                        if algo in pkg.digests:
-                            pkg_info["hash"] = f"{algo}={pkg.digests[algo]}"
-                            break
-
-                packages.append(pkg_info)
-
-            return packages
-
-        # No upstream had the project
-        return []
-
-    async def stream_wheel(self, url: str) -> AsyncIterator[bytes]:
+            if version_spec and pkg.version and not _version_matches(version_spec, pkg.version):
+                continue
+
+            # Build package info dict
+            pkg_info: dict[str, str | None] = {
+                "filename": pkg.filename,
+                "url": pkg.url,
+                "requires_python": pkg.requires_python,
+                "hash": _best_hash(pkg.digests),
+            }
+            packages.append(pkg_info)
+            # Like a linear scan, the first duplicate filename wins
+            by_filename.setdefault(pkg.filename, pkg_info)
+
+        _lru_put(self._packages_cache, key, (wheels, packages, by_filename), _PAGE_CACHE_SIZE)
+        return packages, by_filename
+
+    async def _fetch_project_wheels(
+        self, upstream_url: str, project: str
+    ) -> list[DistributionPackage] | None:
+        """Fetch the wheels on a project page from one upstream.
+
+        Parsed pages are cached in memory. A fresh entry is returned without any
+        request; a stale one is revalidated with ``If-None-Match`` so an
+        unchanged page comes back as a 304 and is not transferred or parsed again.
+
+        Returns:
+            The wheels on the page, or None if the upstream doesn't have it
+        """
+        url = f"{upstream_url.rstrip('/')}/{project}/"
+        cached = _lru_get(self._page_cache, url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[2]
+
+        headers = {"Accept": _PAGE_ACCEPT}
+        if cached is not None and cached[1]:
+            headers["If-None-Match"] = cached[1]
+
+        try:
+            response = await self.client.get(url, headers=headers)
+            if response.status_code == 404:
+                return None
+            if cached is not None and response.status_code == 304:
+                entry = (_expires_at(response), cached[1], cached[2])
+                _lru_put(self._page_cache, url, entry, _PAGE_CACHE_SIZE)
+                return cached[2]
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+
+        # Parse off the event loop, relative to the final page URL
+        wheels = await asyncio.to_thread(_parse_project_wheels, project, response)
+        entry = (_expires_at(response), response.headers.get("etag"), wheels)
+        _lru_put(self._page_cache, url, entry, _PAGE_CACHE_SIZE)
+        return wheels
+
+    async def stream_wheel(self, url: str, chunk_size: int | None = None) -> AsyncIterator[bytes]:
         """Stream wheel bytes from an upstream URL.
 
         Args:
             url: Full URL to the wheel file
+            chunk_size: Size of the yielded chunks (default: as received)
 
         Yields:
             Chunks of wheel bytes
         """
-        async with self.client.stream("GET", url) as response:
+        # Wheels are already ZIP-compressed, so ask for them as-is and pass the
+        # body through without running it through httpx's decoders
+        headers = {"Accept-Encoding": "identity"}
+        async with self.client.stream("GET", url, headers=headers) as response:
             response.raise_for_status()
-            async for chunk in response.aiter_bytes():
+            if response.headers.get("content-encoding", "identity") == "identity":
+                chunks = response.aiter_raw(chunk_size)
+            else:
+                chunks = response.aiter_bytes(chunk_size)
+            async for chunk in chunks:
                 yield chunk
 
-    async def download_wheel(self, url: str) -> bytes:
-        """Download a complete wheel from upstream.
+    async def download_wheel_to_file(self, url: str, fp: IO[bytes]) -> None:
+        """Download a wheel from upstream into a binary file.
 
         Args:
             url: Full URL to the wheel file
-
-        Returns:
-            Complete wheel bytes
-        """
-        chunks = []
-        async for chunk in self.stream_wheel(url):
-            chunks.append(chunk)
-        return b"".join(chunks)
-
-    def find_package_url(
-        self,
-        packages: list[dict[str, str | None]],
-        original_filename: str,
-    ) -> str | None:
-        """Find the upstream URL for a package by its original filename.
-
-        Args:
-            packages: List of package dicts
-            original_filename: The original (non-renamed) filename to find
-
-        Returns:
-            URL to download the package, or None if not found
+            fp: File to write the wheel to
         """
-        for pkg in packages:
-            if pkg["filename"] == original_filename:
-                return pkg["url"]
-        return None
+        async for chunk in self.stream_wheel(url, chunk_size=_DOWNLOAD_CHUNK_SIZE):
+            fp.write(chunk)
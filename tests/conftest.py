@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
 import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,7 +17,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 
 def create_test_wheel(
@@ -30,10 +36,16 @@ def create_test_wheel(
 
     Each module has functions that return version identifiers.
     """
-    wheel_name = f"{pkg_name}-{version}-py3-none-any.whl"
-    wheel_path = tmp_path / wheel_name
+    wheel_path = tmp_path / f"{pkg_name}-{version}-py3-none-any.whl"
+    wheel_path.write_bytes(_build_test_wheel(pkg_name, version, with_submodule))
+    return wheel_path
+
 
-    with zipfile.ZipFile(wheel_path, "w") as zf:
+@functools.cache
+def _build_test_wheel(pkg_name: str, version: str, with_submodule: bool) -> bytes:
+    """Build the bytes of a create_test_wheel wheel, once per set of arguments."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
         # __init__.py - imports core and exposes version
         init_content = f'''"""Test package {pkg_name} version {version}."""
 
@@ -131,7 +143,7 @@ Tag: py3-none-any
         # Empty RECORD (not validating hashes in tests)
         zf.writestr(f"{pkg_name}-{version}.dist-info/RECORD", "")
 
-    return wheel_path
+    return buffer.getvalue()
 
 
 @pytest.fixture
@@ -140,21 +152,94 @@ def create_wheel() -> Callable[[Path, str, str, bool], Path]:
     return create_test_wheel
 
 
+@pytest.fixture(scope="session")
+def _base_venv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one pristine venv per session for dual_install_venv to clone."""
+    venv_dir = tmp_path_factory.mktemp("base") / "venv"
+    subprocess.run(
+        [sys.executable, "-m", "venv", str(venv_dir)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return venv_dir
+
+
+def clone_venv(base_dir: Path, venv_dir: Path) -> None:
+    """Copy a venv to a new location.
+
+    Creating a venv (and bootstrapping pip into it) is far slower than copying
+    one. Scripts in the bin directory have the venv path baked into their
+    shebangs and activate scripts, so those are rewritten to the new location.
+    """
+    shutil.copytree(base_dir, venv_dir, symlinks=True)
+
+    old_path = str(base_dir).encode()
+    new_path = str(venv_dir).encode()
+    for script in get_venv_python(venv_dir).parent.iterdir():
+        if script.is_symlink() or not script.is_file():
+            continue
+        content = script.read_bytes()
+        # Leave binary launchers alone (so use ``python -m pip``, not the
+        # pip script); only text scripts embed the path
+        if old_path in content and b"\0" not in content:
+            script.write_bytes(content.replace(old_path, new_path))
+
+
 @pytest.fixture
-def dual_install_venv(tmp_path: Path) -> Path:
+def dual_install_venv(tmp_path: Path, _base_venv: Path) -> Path:
     """Create a fresh venv for dual-install testing.
 
-    Returns the venv directory path. Use run_in_venv() to execute code.
+    Each test gets its own copy of a session-wide base venv. Returns the venv
+    directory path. Use run_in_venv() to execute code.
     """
     venv_dir = tmp_path / "venv"
-    subprocess.run(
-        [sys.executable, "-m", "venv", str(venv_dir)],
-        check=True,
-        capture_output=True,
-    )
+    clone_venv(_base_venv, venv_dir)
     return venv_dir
 
 
+@pytest.fixture(scope="session")
+def wheel_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory where downloaded wheels are kept for reuse.
+
+    By default wheels are shared by every test in the session. Set
+    SPARE_TIRE_WHEEL_CACHE to keep them across sessions as well (e.g. with a
+    CI cache), at the cost of not seeing newer uploads to the index.
+    """
+    cache_dir = os.environ.get("SPARE_TIRE_WHEEL_CACHE")
+    if cache_dir:
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return tmp_path_factory.mktemp("wheels")
+
+
+def download_cached_wheel(
+    cache_dir: Path, package: str, *, index_url: str, version: str | None = None
+) -> Path | None:
+    """Download the best compatible wheel once per cache directory.
+
+    Downloads are keyed on the index, package, version constraint and
+    interpreter. A wheel is downloaded into a private directory and moved
+    into place, so concurrent test workers never see a partial file.
+    """
+    from spare_tire.download import download_compatible_wheel
+
+    key = f"{index_url}\0{package}\0{version}\0{sys.implementation.cache_tag}"
+    entry_dir = cache_dir / hashlib.sha256(key.encode()).hexdigest()[:16]
+    cached = sorted(entry_dir.glob("*.whl"))
+    if cached:
+        return cached[0]
+
+    with tempfile.TemporaryDirectory(dir=cache_dir) as download_dir:
+        wheel = download_compatible_wheel(
+            package, Path(download_dir), index_url=index_url, version=version
+        )
+        if wheel is None:
+            return None
+        entry_dir.mkdir(exist_ok=True)
+        return Path(shutil.move(wheel, entry_dir / wheel.name))
+
+
 def get_venv_python(venv_dir: Path) -> Path:
     """Get the Python executable path for a venv."""
     if sys.platform == "win32":
@@ -162,13 +247,6 @@ def get_venv_python(venv_dir: Path) -> Path:
     return venv_dir / "bin" / "python"
 
 
-def get_venv_pip(venv_dir: Path) -> Path:
-    """Get the pip executable path for a venv."""
-    if sys.platform == "win32":
-        return venv_dir / "Scripts" / "pip.exe"
-    return venv_dir / "bin" / "pip"
-
-
 def run_in_venv(venv_dir: Path, code: str) -> subprocess.CompletedProcess[str]:
     """Execute Python code in the venv and return the result.
 
@@ -187,13 +265,33 @@ def run_in_venv(venv_dir: Path, code: str) -> subprocess.CompletedProcess[str]:
     )
 
 
-def install_wheel_in_venv(venv_dir: Path, wheel_path: Path) -> None:
-    """Install a wheel in the venv."""
-    pip = get_venv_pip(venv_dir)
+def install_wheels_in_venv(
+    venv_dir: Path, wheel_paths: Sequence[Path], *, no_deps: bool = True
+) -> None:
+    """Install several wheels in the venv with a single pip invocation.
+
+    Each pip run pays for starting the interpreter and the resolver, so
+    fixtures that need more than one wheel should install them together.
+    Test wheels have no dependencies, so by default pip neither resolves
+    requirements nor consults an index; pass ``no_deps=False`` for real
+    wheels that need theirs installed.
+    """
+    # Run pip through the venv's interpreter: the pip.exe launcher copied by
+    # clone_venv on Windows still points at the base venv's interpreter
+    python = get_venv_python(venv_dir)
+    args = [str(python), "-m", "pip", "install", "--quiet", "--disable-pip-version-check"]
+    if no_deps:
+        args += ["--no-deps", "--no-index"]
     result = subprocess.run(
-        [str(pip), "install", str(wheel_path)],
+        [*args, *map(str, wheel_paths)],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
-        raise RuntimeError(f"Failed to install {wheel_path}: {result.stderr}")
+        names = ", ".join(path.name for path in wheel_paths)
+        raise RuntimeError(f"Failed to install {names}: {result.stderr}")
+
+
+def install_wheel_in_venv(venv_dir: Path, wheel_path: Path, *, no_deps: bool = True) -> None:
+    """Install a wheel in the venv."""
+    install_wheels_in_venv(venv_dir, [wheel_path], no_deps=no_deps)
@@ -0,0 +1,53 @@
+"""Tests for proxy configuration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from spare_tire.server.config import ProxyConfig, RenameRule, load_config
+
+
+class TestRenameRuleLookup:
+    def test_normalized_lookup(self) -> None:
+        config = ProxyConfig(renames=[RenameRule("icechunk", "icechunk_v1", "<2")])
+        rule = config.get_rename_rule("Icechunk-V1")
+        assert rule is not None
+        assert rule.original == "icechunk"
+
+    def test_first_rule_wins(self) -> None:
+        first = RenameRule("a", "pkg_v1")
+        config = ProxyConfig(renames=[first, RenameRule("b", "pkg-v1")])
+        assert config.get_rename_rule("pkg_v1") is first
+
+    def test_load_config_indexes_rules(self, tmp_path: Path) -> None:
+        """Test rules from the config file and CLI end up in the lookup index."""
+        config_path = tmp_path / "proxy.toml"
+        config_path.write_text('[renames]\nicechunk = { name = "icechunk_v1", version = "<2" }\n')
+
+        config = load_config(config_path)
+        rule = config.get_rename_rule("icechunk-v1")
+        assert rule == RenameRule("icechunk", "icechunk_v1", "<2")
+
+        config = load_config(config_path, renames=["zarr=zarr_v2"])
+        assert config.get_rename_rule("icechunk_v1") is None
+        assert config.get_original_for_renamed("zarr-v2") == "zarr"
+
+
+class TestCacheOptions:
+    def test_file_and_cli_options(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "proxy.toml"
+        config_path.write_text('[proxy]\ncache_dir = "wheels"\ncache_max_size_mb = 10\n')
+
+        config = load_config(config_path)
+        assert config.cache_dir == Path("wheels")
+        assert config.cache_max_size == 10 * 1024**2
+
+        config = load_config(config_path, cache_dir=tmp_path, cache_max_size_mb=1)
+        assert (config.cache_dir, config.cache_max_size) == (tmp_path, 1024**2)
+
+        assert load_config(config_path, no_cache=True).cache_dir is None
+
+    def test_cache_disabled_in_file(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "proxy.toml"
+        config_path.write_text("[proxy]\ncache = false\n")
+        assert load_config(config_path).cache_dir is None
@@ -0,0 +1,240 @@
+"""Tests for index download helpers."""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from packaging.tags import Tag
+from pypi_simple import DistributionPackage, PyPISimple
+
+from spare_tire.download import (
+    _get_client,
+    _get_project_packages,
+    _page_cache_path,
+    _read_page_cache,
+    _stream_to,
+    _write_page_cache,
+    best_wheel,
+    parse_wheel_tags,
+)
+
+
+def make_package(filename: str, version: str) -> DistributionPackage:
+    """Create a wheel DistributionPackage without touching the network."""
+    return DistributionPackage(
+        filename=filename,
+        url=f"https://example.invalid/files/{filename}",
+        project="mypkg",
+        version=version,
+        package_type="wheel",
+        digests={"sha256": "0" * 64},
+        requires_python=">=3.11",
+        has_sig=None,
+    )
+
+
+class TestParseWheelTags:
+    def test_multi_platform(self) -> None:
+        tags = parse_wheel_tags(
+            "numpy-1.24.0-cp311-cp311-manylinux_2_17_x86_64.manylinux2014_x86_64.whl"
+        )
+        assert set(tags) == {
+            Tag("cp311", "cp311", "manylinux_2_17_x86_64"),
+            Tag("cp311", "cp311", "manylinux2014_x86_64"),
+        }
+
+    def test_build_tag(self) -> None:
+        assert set(parse_wheel_tags("mypkg-1.0.0-1-py3-none-any.whl")) == {
+            Tag("py3", "none", "any")
+        }
+
+    def test_compressed_tag_set(self) -> None:
+        assert parse_wheel_tags("six-1.17.0-py2.py3-none-any.whl") == {
+            Tag("py2", "none", "any"),
+            Tag("py3", "none", "any"),
+        }
+
+    def test_invalid_filename(self) -> None:
+        assert not parse_wheel_tags("mypkg.whl")
+
+
+class TestBestWheel:
+    def test_prefers_more_specific_tag(self) -> None:
+        """Test that among equal versions the highest-priority tag wins."""
+        generic = make_package("mypkg-1.0.0-py3-none-any.whl", "1.0.0")
+        specific = make_package("mypkg-1.0.0-cp311-cp311-linux_x86_64.whl", "1.0.0")
+        tags = [Tag("cp311", "cp311", "linux_x86_64"), Tag("py3", "none", "any")]
+        assert best_wheel([generic, specific], tags) is specific
+
+    def test_full_pep440_ordering(self) -> None:
+        """Test that dev/post releases and 4-segment versions are ordered correctly."""
+        tags = [Tag("py3", "none", "any")]
+        dev = make_package("mypkg-2.0.0.dev1-py3-none-any.whl", "2.0.0.dev1")
+        final = make_package("mypkg-2.0.0-py3-none-any.whl", "2.0.0")
+        post = make_package("mypkg-2.0.0.post1-py3-none-any.whl", "2.0.0.post1")
+        assert best_wheel([post, final, dev], tags) is post
+        assert best_wheel([dev, final], tags) is final
+
+        older = make_package("mypkg-1.0.0.1-py3-none-any.whl", "1.0.0.1")
+        newer = make_package("mypkg-1.0.0.2-py3-none-any.whl", "1.0.0.2")
+        assert best_wheel([older, newer], tags) is newer
+
+    def test_newer_version_beats_better_tag(self) -> None:
+        """Test that version takes precedence over tag specificity."""
+        tags = [Tag("cp311", "cp311", "linux_x86_64"), Tag("py3", "none", "any")]
+        old_specific = make_package("mypkg-1.0.0-cp311-cp311-linux_x86_64.whl", "1.0.0")
+        new_generic = make_package("mypkg-2.0.0-py3-none-any.whl", "2.0.0")
+        new_other = make_package("mypkg-3.0.0-cp311-cp311-win_amd64.whl", "3.0.0")
+        assert best_wheel([old_specific, new_other, new_generic], tags) is new_generic
+
+    def test_tag_priority_map(self) -> None:
+        """Test a precomputed priority map gives the same answer as the tag list."""
+        generic = make_package("mypkg-1.0.0-py3-none-any.whl", "1.0.0")
+        specific = make_package("mypkg-1.0.0-cp311-cp311-linux_x86_64.whl", "1.0.0")
+        tags = [Tag("cp311", "cp311", "linux_x86_64"), Tag("py3", "none", "any")]
+        priority = {tag: i for i, tag in enumerate(tags)}
+        assert best_wheel([generic, specific], tag_priority=priority) is specific
+
+    def test_skips_invalid_version(self) -> None:
+        """Test that a wheel with a non-PEP 440 version doesn't break selection."""
+        tags = [Tag("py3", "none", "any")]
+        legacy = make_package("mypkg-1.0.0-cp27-cp27m-win32.whl", "1.0-legacy")
+        good = make_package("mypkg-1.0.0-py3-none-any.whl", "1.0.0")
+        assert best_wheel([legacy, good], tags) is good
+
+    def test_no_compatible_wheel(self) -> None:
+        pkg = make_package("mypkg-1.0.0-cp311-cp311-win_amd64.whl", "1.0.0")
+        assert best_wheel([pkg], [Tag("py3", "none", "any")]) is None
+
+
+class FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+
+class TestPageCache:
+    @pytest.fixture(autouse=True)
+    def _cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test packages, yanked status and metadata included, survive the cache file."""
+        path = _page_cache_path("https://example.invalid/simple/", "MyPkg")
+        assert path.is_relative_to(tmp_path)
+        assert path.name == "mypkg.json"
+
+        packages = [
+            make_package("mypkg-1.0.0-py3-none-any.whl", "1.0.0"),
+            dataclasses.replace(
+                make_package("mypkg-0.9.0-py3-none-any.whl", "0.9.0"),
+                is_yanked=True,
+                yanked_reason="broken",
+                size=1234,
+                upload_time=datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+                has_metadata=True,
+                metadata_digests={"sha256": "1" * 64},
+            ),
+        ]
+        _write_page_cache(path, '"abc"', packages)
+        plain = tmp_path / "plain"
+        plain.touch()
+        assert path.stat().st_mode == plain.stat().st_mode
+
+        cached = _read_page_cache(path)
+        assert cached is not None
+        etag, restored = cached
+        assert etag == '"abc"'
+        assert restored == packages
+
+    def test_missing_or_corrupt_is_a_miss(self) -> None:
+        """Test unreadable cache files are treated as cache misses."""
+        path = _page_cache_path("https://example.invalid/simple/", "mypkg")
+        assert _read_page_cache(path) is None
+
+        path.parent.mkdir(parents=True)
+        path.write_text("not json")
+        assert _read_page_cache(path) is None
+
+    def test_not_modified_uses_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a 304 response returns the cached packages and sends the ETag."""
+        client = PyPISimple("https://example.invalid/simple/")
+        packages = [make_package("mypkg-1.0.0-py3-none-any.whl", "1.0.0")]
+        _write_page_cache(_page_cache_path(client.endpoint, "mypkg"), '"abc"', packages)
+
+        sent_headers: dict[str, str] = {}
+
+        def fake_get(_url: str, headers: dict[str, str]) -> FakeResponse:
+            sent_headers.update(headers)
+            return FakeResponse(304)
+
+        monkeypatch.setattr(client.s, "get", fake_get)
+
+        assert _get_project_packages(client, "mypkg") == packages
+        assert sent_headers["If-None-Match"] == '"abc"'
+
+
+class FailingStream(io.BytesIO):
+    """A response body that breaks partway through."""
+
+    def read(self, _size: int | None = -1) -> bytes:
+        if self.tell():
+            raise ConnectionError("connection reset")
+        return super().read(4)
+
+
+class FakeStreamResponse:
+    def __init__(self, raw: io.BytesIO) -> None:
+        self.raw = raw
+
+    def __enter__(self) -> FakeStreamResponse:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class TestDownload:
+    def test_client_per_thread(self) -> None:
+        """Test each thread gets its own client, reused within the thread."""
+        index_url = "https://example.invalid/simple/"
+        client = _get_client(index_url)
+        assert _get_client(index_url) is client
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(_get_client, index_url).result()
+        assert other is not client
+
+    def test_stream_to(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = PyPISimple("https://example.invalid/simple/")
+        monkeypatch.setattr(
+            client.s, "get", lambda _url, **_kwargs: FakeStreamResponse(io.BytesIO(b"wheel data"))
+        )
+        path = tmp_path / "mypkg-1.0.0-py3-none-any.whl"
+        _stream_to(client, "https://example.invalid/w.whl", path)
+        assert path.read_bytes() == b"wheel data"
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+    def test_failed_stream_keeps_existing_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed download leaves neither a partial file nor a removed one."""
+        client = PyPISimple("https://example.invalid/simple/")
+        monkeypatch.setattr(
+            client.s, "get", lambda _url, **_kwargs: FakeStreamResponse(FailingStream(b"x" * 100))
+        )
+        path = tmp_path / "mypkg-1.0.0-py3-none-any.whl"
+        path.write_bytes(b"complete")
+
+        with pytest.raises(ConnectionError):
+            _stream_to(client, "https://example.invalid/w.whl", path)
+        assert path.read_bytes() == b"complete"
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
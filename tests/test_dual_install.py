@@ -13,30 +13,40 @@ import pytest
 
 from spare_tire.rename import rename_wheel
 from tests.conftest import (
+    clone_venv,
     create_test_wheel,
     install_wheel_in_venv,
+    install_wheels_in_venv,
     run_in_venv,
 )
 
 
-class TestDualInstallIsolation:
-    """Test that both packages can be installed and remain isolated."""
+@pytest.fixture(scope="class")
+def dual_venv_with_packages(tmp_path_factory: pytest.TempPathFactory, _base_venv: Path) -> Path:
+    """Create a venv with both mypkg (v2) and mypkg_v1 (renamed v1) installed.
 
-    @pytest.fixture
-    def dual_venv_with_packages(self, tmp_path: Path, dual_install_venv: Path) -> Path:
-        """Create a venv with both mypkg (v2) and mypkg_v1 (renamed v1) installed."""
-        # Create v1 wheel and rename it
-        v1_wheel = create_test_wheel(tmp_path, "mypkg", "1.0.0")
-        v1_renamed = rename_wheel(v1_wheel, "mypkg_v1", output_dir=tmp_path / "renamed")
+    The TestDualInstallIsolation tests only import from the venv, so they share one
+    instead of each paying for a venv copy and a pip install.
+    """
+    tmp_path = tmp_path_factory.mktemp("dual")
+    dual_install_venv = tmp_path / "venv"
+    clone_venv(_base_venv, dual_install_venv)
 
-        # Create v2 wheel
-        v2_wheel = create_test_wheel(tmp_path, "mypkg", "2.0.0")
+    # Create v1 wheel and rename it
+    v1_wheel = create_test_wheel(tmp_path, "mypkg", "1.0.0")
+    v1_renamed = rename_wheel(v1_wheel, "mypkg_v1", output_dir=tmp_path / "renamed")
 
-        # Install both
-        install_wheel_in_venv(dual_install_venv, v1_renamed)
-        install_wheel_in_venv(dual_install_venv, v2_wheel)
+    # Create v2 wheel
+    v2_wheel = create_test_wheel(tmp_path, "mypkg", "2.0.0")
+
+    # Install both
+    install_wheels_in_venv(dual_install_venv, [v1_renamed, v2_wheel])
+
+    return dual_install_venv
 
-        return dual_install_venv
+
+class TestDualInstallIsolation:
+    """Test that both packages can be installed and remain isolated."""
 
     def test_both_packages_import_independently(self, dual_venv_with_packages: Path) -> None:
         """Both packages load without errors and return correct versions."""
@@ -170,29 +180,30 @@ class TestNoLeakedReferences:
 
         # Scan for old imports
         code = """
+import ast
 import mypkg_v1
 from pathlib import Path
-import re
 
 pkg_dir = Path(mypkg_v1.__file__).parent
 problems = []
 
-# Patterns that should NOT appear (old package name imports)
-bad_patterns = [
-    r'from mypkg\\s',      # from mypkg import
-    r'from mypkg\\.',      # from mypkg.x import
-    r'import mypkg\\n',    # import mypkg
-    r'import mypkg\\.',    # import mypkg.x
-    r"^import mypkg$",     # import mypkg at end of file
-]
-
+# Absolute imports of the old package name should NOT appear. Parsing finds
+# real import statements only, not matches in strings or comments.
 for py_file in pkg_dir.rglob("*.py"):
-    content = py_file.read_text()
-    rel_path = py_file.relative_to(pkg_dir)
-
-    for pattern in bad_patterns:
-        if re.search(pattern, content, re.MULTILINE):
-            problems.append(f"{rel_path}: matches '{pattern}'")
+    source = py_file.read_bytes()
+    # Only files that mention the name at all can import it; skip parsing the rest
+    if b"mypkg" not in source:
+        continue
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            if module == "mypkg" or module.startswith("mypkg."):
+                problems.append(f"{py_file.relative_to(pkg_dir)}:{node.lineno}: imports {module}")
 
 if problems:
     print("PROBLEMS FOUND:")
@@ -277,8 +288,7 @@ def get_tag():
 
         # Rename v1 and install both
         v1_renamed = rename_wheel(v1_wheel_path, "lazypkg_v1", output_dir=tmp_path / "renamed")
-        install_wheel_in_venv(dual_install_venv, v1_renamed)
-        install_wheel_in_venv(dual_install_venv, v2_wheel_path)
+        install_wheels_in_venv(dual_install_venv, [v1_renamed, v2_wheel_path])
 
         # Test lazy imports
         code = """
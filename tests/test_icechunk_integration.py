@@ -12,10 +12,15 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from packaging.version import Version
 
-from spare_tire.download import download_compatible_wheel
 from spare_tire.rename import rename_wheel
-from tests.conftest import install_wheel_in_venv, run_in_venv
+from tests.conftest import (
+    download_cached_wheel,
+    install_wheel_in_venv,
+    install_wheels_in_venv,
+    run_in_venv,
+)
 
 NIGHTLY_INDEX = "https://pypi.anaconda.org/scientific-python-nightly-wheels/simple"
 
@@ -25,18 +30,17 @@ class TestIcechunkDualInstall:
     """Test with real icechunk wheels from nightly builds."""
 
     @pytest.fixture
-    def icechunk_dual_venv(self, tmp_path: Path, dual_install_venv: Path) -> Path:
+    def icechunk_dual_venv(
+        self, tmp_path: Path, dual_install_venv: Path, wheel_cache_dir: Path
+    ) -> Path:
         """Create a venv with both icechunk v1 and v2 installed.
 
         Downloads from nightly index, renames v1 to icechunk_v1.
         """
-        wheels_dir = tmp_path / "wheels"
-        wheels_dir.mkdir()
-
         # Download v1 (< 2.0)
-        v1_wheel = download_compatible_wheel(
+        v1_wheel = download_cached_wheel(
+            wheel_cache_dir,
             "icechunk",
-            wheels_dir,
             index_url=NIGHTLY_INDEX,
             version="<2",
         )
@@ -49,9 +53,9 @@ class TestIcechunkDualInstall:
         v1_renamed = rename_wheel(v1_wheel, "icechunk_v1", output_dir=tmp_path / "renamed")
 
         # Download v2 (>= 2.0.0.dev0)
-        v2_wheel = download_compatible_wheel(
+        v2_wheel = download_cached_wheel(
+            wheel_cache_dir,
             "icechunk",
-            wheels_dir,
             index_url=NIGHTLY_INDEX,
             version=">=2.0.0.dev0",
         )
@@ -61,8 +65,7 @@ class TestIcechunkDualInstall:
         )
 
         # Install both
-        install_wheel_in_venv(dual_install_venv, v1_renamed)
-        install_wheel_in_venv(dual_install_venv, v2_wheel)
+        install_wheels_in_venv(dual_install_venv, [v1_renamed, v2_wheel], no_deps=False)
 
         return dual_install_venv
 
@@ -89,31 +92,18 @@ print("PASS")
         code = """
 import icechunk_v1
 import icechunk
-from packaging.version import Version
-
-v1 = Version(icechunk_v1.__version__)
-v2 = Version(icechunk.__version__)
 
-print(f"icechunk_v1 version: {v1}")
-print(f"icechunk version: {v2}")
-
-assert v1 < Version("2.0.0"), f"v1 should be < 2.0.0, got {v1}"
-assert v2 >= Version("2.0.0a0.dev0"), f"v2 should be >= 2.0.0.dev0, got {v2}"
-print("PASS")
+print(icechunk_v1.__version__)
+print(icechunk.__version__)
 """
         result = run_in_venv(icechunk_dual_venv, code)
-        # packaging might not be installed, install it first
-        if "No module named 'packaging'" in result.stderr:
-            import subprocess
-
-            from tests.conftest import get_venv_pip
-
-            pip = get_venv_pip(icechunk_dual_venv)
-            subprocess.run([str(pip), "install", "packaging"], check=True)
-            result = run_in_venv(icechunk_dual_venv, code)
-
         assert result.returncode == 0, f"Failed: {result.stderr}\n{result.stdout}"
-        assert "PASS" in result.stdout
+
+        # Compare on this side, where packaging is available, rather than
+        # installing it into the venv under test
+        v1, v2 = (Version(line) for line in result.stdout.splitlines()[-2:])
+        assert v1 < Version("2.0.0"), f"v1 should be < 2.0.0, got {v1}"
+        assert v2 >= Version("2.0.0a0.dev0"), f"v2 should be >= 2.0.0.dev0, got {v2}"
 
     def test_no_import_contamination(self, icechunk_dual_venv: Path) -> None:
         """Verify icechunk_v1 doesn't accidentally import from icechunk."""
@@ -152,28 +142,30 @@ print("PASS")
     def test_scan_for_old_imports(self, icechunk_dual_venv: Path) -> None:
         """Scan all .py files in icechunk_v1 for references to 'icechunk' (the old name)."""
         code = """
+import ast
 import icechunk_v1
 from pathlib import Path
-import re
 
 pkg_dir = Path(icechunk_v1.__file__).parent
 problems = []
 
-# Patterns that indicate old package name references
-# We look for imports that reference 'icechunk' without the '_v1' suffix
-bad_patterns = [
-    (r'from icechunk(?!_v1)[\\s\\.]', 'from icechunk import'),
-    (r'import icechunk(?!_v1)(?:[\\s\\n]|$)', 'import icechunk'),
-]
-
+# Absolute imports of 'icechunk' itself rather than 'icechunk_v1'. Parsing finds
+# real import statements only, not matches in strings or comments.
 for py_file in pkg_dir.rglob("*.py"):
-    content = py_file.read_text()
-    rel_path = py_file.relative_to(pkg_dir)
-
-    for pattern, desc in bad_patterns:
-        matches = re.findall(pattern, content)
-        if matches:
-            problems.append(f"{rel_path}: found '{desc}' pattern")
+    source = py_file.read_bytes()
+    # Only files that mention the name at all can import it; skip parsing the rest
+    if b"icechunk" not in source:
+        continue
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            if module == "icechunk" or module.startswith("icechunk."):
+                problems.append(f"{py_file.relative_to(pkg_dir)}:{node.lineno}: imports {module}")
 
 if problems:
     print("PROBLEMS FOUND:")
@@ -195,15 +187,14 @@ class TestIcechunkFunctionality:
     """Test that renamed icechunk actually works (not just imports)."""
 
     @pytest.fixture
-    def icechunk_v1_venv(self, tmp_path: Path, dual_install_venv: Path) -> Path:
+    def icechunk_v1_venv(
+        self, tmp_path: Path, dual_install_venv: Path, wheel_cache_dir: Path
+    ) -> Path:
         """Create a venv with just icechunk_v1 installed."""
-        wheels_dir = tmp_path / "wheels"
-        wheels_dir.mkdir()
-
         # Download v1
-        v1_wheel = download_compatible_wheel(
+        v1_wheel = download_cached_wheel(
+            wheel_cache_dir,
             "icechunk",
-            wheels_dir,
             index_url=NIGHTLY_INDEX,
             version="<2",
         )
@@ -211,7 +202,7 @@ class TestIcechunkFunctionality:
 
         # Rename and install
         v1_renamed = rename_wheel(v1_wheel, "icechunk_v1", output_dir=tmp_path / "renamed")
-        install_wheel_in_venv(dual_install_venv, v1_renamed)
+        install_wheel_in_venv(dual_install_venv, v1_renamed, no_deps=False)
 
         return dual_install_venv
 
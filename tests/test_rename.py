@@ -2,32 +2,39 @@
 
 from __future__ import annotations
 
+import io
 import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
 
 from spare_tire.rename import (
+    _RAW_COPY_SUPPORTED,
     _build_wheel_filename,
     _compute_record_hash,
     _normalize_name,
     _parse_wheel_filename,
+    _set_compress_level,
+    _update_metadata,
+    _update_python_imports,
     rename_wheel,
+    rename_wheel_from_bytes,
 )
 
 
 class TestNormalizeName:
-    def test_lowercase(self) -> None:
-        assert _normalize_name("MyPackage") == "mypackage"
-
-    def test_hyphens_to_underscores(self) -> None:
-        assert _normalize_name("my-package") == "my_package"
-
-    def test_dots_to_underscores(self) -> None:
-        assert _normalize_name("my.package") == "my_package"
-
-    def test_multiple_separators(self) -> None:
-        assert _normalize_name("My--Package..Name") == "my_package_name"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            pytest.param("MyPackage", "mypackage", id="lowercase"),
+            pytest.param("my-package", "my_package", id="hyphens-to-underscores"),
+            pytest.param("my.package", "my_package", id="dots-to-underscores"),
+            pytest.param("My--Package..Name", "my_package_name", id="multiple-separators"),
+        ],
+    )
+    def test_normalize(self, name: str, expected: str) -> None:
+        assert _normalize_name(name) == expected
 
 
 class TestParseWheelFilename:
@@ -90,6 +97,78 @@ class TestComputeRecordHash:
         assert result == "sha256=uU0nuZNNPgilLlLX2n2r-sSE7-N6U4DukIj3rOLvzek"
 
 
+class TestUpdateMetadata:
+    def test_only_header_name_replaced(self) -> None:
+        content = b"Metadata-Version: 2.1\nName: mypkg\nVersion: 1.0\n\nName: in the description\n"
+        assert _update_metadata(content, "mypkg", "mypkg_v1") == (
+            b"Metadata-Version: 2.1\nName: mypkg_v1\nVersion: 1.0\n\nName: in the description\n"
+        )
+
+
+class TestUpdatePythonImports:
+    def test_rewrites_imports(self) -> None:
+        content = b"import mypkg\nfrom mypkg.sub import x\n    import mypkg as m, os\n"
+        result = _update_python_imports(content, b"mypkg", b"mypkg_v1")
+        assert result == (
+            b"import mypkg_v1\nfrom mypkg_v1.sub import x\n    import mypkg_v1 as m, os\n"
+        )
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(b"try: import mypkg\n", b"try: import mypkg_v1\n", id="after-colon"),
+            pytest.param(
+                b"if TYPE_CHECKING: from mypkg import x\n",
+                b"if TYPE_CHECKING: from mypkg_v1 import x\n",
+                id="after-if-colon",
+            ),
+            pytest.param(
+                b"import os; import mypkg\n", b"import os; import mypkg_v1\n", id="after-semicolon"
+            ),
+            pytest.param(
+                b"import mypkg; from mypkg.sub import y\n",
+                b"import mypkg_v1; from mypkg_v1.sub import y\n",
+                id="two-statements",
+            ),
+        ],
+    )
+    def test_rewrites_compound_statements(self, content: bytes, expected: bytes) -> None:
+        """Test imports following a ``:`` or ``;`` on the same line are rewritten."""
+        assert _update_python_imports(content, b"mypkg", b"mypkg_v1") == expected
+
+    def test_leaves_other_names_alone(self) -> None:
+        """Test partial matches, imported attributes and comments are not rewritten."""
+        content = b"import mypkg_extra\nfrom other import mypkg\nimport os  # mypkg, too\n"
+        assert _update_python_imports(content, b"mypkg", b"mypkg_v1") == content
+
+    def test_unrelated_file_returned_unchanged(self) -> None:
+        """Test files not mentioning the old name are not scanned at all."""
+        content = b"# latin-1: \xe9\nimport os\n"
+        assert _update_python_imports(content, b"mypkg", b"mypkg_v1") is content
+
+
+class TestZipfileInternals:
+    """The raw entry copy relies on undocumented zipfile internals."""
+
+    def test_raw_copy_supported(self) -> None:
+        """Test this Python still has the internals, so raw copies aren't silently skipped."""
+        assert _RAW_COPY_SUPPORTED
+
+    def test_set_compress_level(self) -> None:
+        """Test the level set on an entry is the one writestr compresses with."""
+        blob = bytes(range(256)) * 1000
+        sizes = []
+        for level in (1, 9):
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                info = zipfile.ZipInfo("data.bin")
+                info.compress_type = zipfile.ZIP_DEFLATED
+                _set_compress_level(info, level)
+                zf.writestr(info, blob)
+                sizes.append(zf.getinfo("data.bin").compress_size)
+        assert sizes[0] > sizes[1]
+
+
 class TestRenameWheel:
     def test_rename_pure_python_wheel(self, tmp_path: Path) -> None:
         """Test renaming a simple pure Python wheel."""
@@ -132,11 +211,114 @@ class TestRenameWheel:
             metadata = zf.read("testpkg_v1-0.1.0.dist-info/METADATA").decode()
             assert "Name: testpkg_v1" in metadata
 
+    def test_unchanged_entries_copied_raw(self, tmp_path: Path) -> None:
+        """Test unchanged entries keep their compressed bytes and RECORD hashes."""
+        wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
+        blob = bytes(range(256)) * 1000
+        with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("testpkg/_ext.so", blob, compresslevel=9)
+            zf.writestr("testpkg/stored.bin", blob, compress_type=zipfile.ZIP_STORED)
+            zf.writestr("testpkg-0.1.0.dist-info/METADATA", "Name: testpkg\n")
+            zf.writestr("testpkg-0.1.0.dist-info/RECORD", "")
+
+        result = rename_wheel(wheel_path, "testpkg_v1", output_dir=tmp_path / "output")
+
+        with zipfile.ZipFile(wheel_path) as src, zipfile.ZipFile(result) as dst:
+            assert dst.testzip() is None
+            record = dst.read("testpkg_v1-0.1.0.dist-info/RECORD").decode()
+            for name in ("_ext.so", "stored.bin"):
+                old = src.getinfo(f"testpkg/{name}")
+                new = dst.getinfo(f"testpkg_v1/{name}")
+                assert (new.compress_type, new.compress_size) == (
+                    old.compress_type,
+                    old.compress_size,
+                )
+                assert dst.read(new) == blob
+                assert f"testpkg_v1/{name},{_compute_record_hash(blob)},{len(blob)}" in record
+
+    def test_record_hashes_reused(self, tmp_path: Path) -> None:
+        """Test unchanged entries take their hash from RECORD when its size matches."""
+        wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
+        listed = "sha256=" + "A" * 43
+        with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("testpkg/data.bin", b"data")
+            zf.writestr("testpkg/stale.bin", b"stale")
+            zf.writestr("testpkg-0.1.0.dist-info/METADATA", "Name: testpkg\n")
+            zf.writestr(
+                "testpkg-0.1.0.dist-info/RECORD",
+                f"testpkg/data.bin,{listed},4\ntestpkg/stale.bin,{listed},4\n",
+            )
+
+        result = rename_wheel(wheel_path, "testpkg_v1", output_dir=tmp_path / "output")
+
+        with zipfile.ZipFile(result) as zf:
+            record = zf.read("testpkg_v1-0.1.0.dist-info/RECORD").decode().splitlines()
+        assert f"testpkg_v1/data.bin,{listed},4" in record
+        assert f"testpkg_v1/stale.bin,{_compute_record_hash(b'stale')},5" in record
+
+    def test_unreadable_record_rehashed(self, tmp_path: Path) -> None:
+        """Test a RECORD that isn't UTF-8 doesn't fail the rename; entries are re-hashed."""
+        wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
+        listed = "sha256=" + "A" * 43
+        with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("testpkg/data.bin", b"data")
+            zf.writestr("testpkg-0.1.0.dist-info/METADATA", "Name: testpkg\n")
+            zf.writestr(
+                "testpkg-0.1.0.dist-info/RECORD",
+                f"testpkg/caf\xe9.py,,\ntestpkg/data.bin,{listed},4\n".encode("latin-1"),
+            )
+
+        result = rename_wheel(wheel_path, "testpkg_v1", output_dir=tmp_path / "output")
+
+        with zipfile.ZipFile(result) as zf:
+            record = zf.read("testpkg_v1-0.1.0.dist-info/RECORD").decode().splitlines()
+        assert f"testpkg_v1/data.bin,{_compute_record_hash(b'data')},4" in record
+
+    def test_from_bytes_already_renamed(self, tmp_path: Path) -> None:
+        """Test renaming a wheel to the name it already has returns the input."""
+        wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
+        with zipfile.ZipFile(wheel_path, "w") as zf:
+            zf.writestr("testpkg/__init__.py", "")
+            zf.writestr("testpkg-0.1.0.dist-info/METADATA", "Name: testpkg\n")
+            zf.writestr("testpkg-0.1.0.dist-info/RECORD", "")
+
+        renamed = rename_wheel_from_bytes(wheel_path.read_bytes(), "testpkg_v1")
+        assert rename_wheel_from_bytes(renamed, "testpkg-v1") is renamed
+
     def test_rename_wheel_not_found(self, tmp_path: Path) -> None:
         """Test error when wheel doesn't exist."""
         with pytest.raises(FileNotFoundError):
             rename_wheel(tmp_path / "nonexistent.whl", "newname")
 
+    def test_failed_rename_leaves_no_output(self, tmp_path: Path) -> None:
+        """Test a rename that fails partway leaves nothing in the output directory."""
+        wheel_path = tmp_path / "bad-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("bad-1.0.dist-info/METADATA", "Name: bad\n")
+            zf.writestr("bad/data.bin", b"x" * 1000)
+        with zipfile.ZipFile(wheel_path) as zf:
+            info = zf.getinfo("bad/data.bin")
+        # Overwrite the deflate stream, just after its 30-byte local header
+        data = bytearray(wheel_path.read_bytes())
+        start = info.header_offset + 30 + len(info.filename)
+        data[start : start + info.compress_size] = b"\xff" * info.compress_size
+        wheel_path.write_bytes(data)
+
+        output_dir = tmp_path / "output"
+        with pytest.raises((zlib.error, zipfile.BadZipFile)):
+            rename_wheel(wheel_path, "bad_v1", output_dir=output_dir)
+        assert list(output_dir.iterdir()) == []
+
+    def test_output_has_default_mode(self, tmp_path: Path) -> None:
+        """Test the renamed wheel gets the same permissions as a normally written file."""
+        wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
+        with zipfile.ZipFile(wheel_path, "w") as zf:
+            zf.writestr("testpkg/__init__.py", "")
+            zf.writestr("testpkg-0.1.0.dist-info/METADATA", "Name: testpkg\n")
+
+        output_path = rename_wheel(wheel_path, "testpkg_v1", output_dir=tmp_path / "output")
+        assert output_path.stat().st_mode == wheel_path.stat().st_mode
+
     def test_rename_same_name_error(self, tmp_path: Path) -> None:
         """Test error when new name is the same as old name."""
         wheel_path = tmp_path / "testpkg-0.1.0-py3-none-any.whl"
@@ -0,0 +1,135 @@
+"""Tests for the proxy server's renamed wheel handling."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import zipfile
+from typing import IO, TYPE_CHECKING, cast
+
+from spare_tire import rename
+from spare_tire.server import stream
+from spare_tire.server.stream import (
+    prune_wheel_cache,
+    renamed_wheel_cache_path,
+    stream_and_rename_wheel,
+    use_cached_wheel,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from spare_tire.server.upstream import UpstreamClient
+
+
+class FakeUpstream:
+    """Stands in for UpstreamClient, serving one wheel's bytes."""
+
+    def __init__(self, wheel_bytes: bytes) -> None:
+        self.wheel_bytes = wheel_bytes
+
+    async def download_wheel_to_file(self, _url: str, fp: IO[bytes]) -> None:
+        fp.write(self.wheel_bytes)
+
+
+def make_client() -> UpstreamClient:
+    """Create a fake upstream client serving a small mypkg wheel."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("mypkg/__init__.py", "from mypkg.core import x\n")
+        zf.writestr("mypkg-1.0.dist-info/METADATA", "Name: mypkg\nVersion: 1.0\n")
+        zf.writestr("mypkg-1.0.dist-info/RECORD", "")
+    return cast("UpstreamClient", FakeUpstream(buffer.getvalue()))
+
+
+class TestRenamedWheelCache:
+    def test_written_to_cache(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache" / "key.whl"
+        client = make_client()
+
+        dest, is_temporary = asyncio.run(
+            stream_and_rename_wheel(client, "https://example.invalid/w.whl", "mypkg_v1", cache_path)
+        )
+
+        assert (dest, is_temporary) == (cache_path, False)
+        with zipfile.ZipFile(dest) as zf:
+            assert zf.read("mypkg_v1/__init__.py") == b"from mypkg_v1.core import x\n"
+        plain = tmp_path / "plain"
+        plain.touch()
+        assert dest.stat().st_mode == plain.stat().st_mode
+
+    def test_unwritable_cache_falls_back(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cache directory that exists but can't be written to is skipped."""
+        cache_path = tmp_path / "cache" / "key.whl"
+        cache_path.parent.mkdir()
+        make_temp_file = rename.make_temp_file
+
+        def read_only_make_temp_file(directory: Path, suffix: str = ".tmp") -> tuple[int, str]:
+            if directory == cache_path.parent:
+                raise PermissionError(13, "Permission denied")
+            return make_temp_file(directory, suffix)
+
+        monkeypatch.setattr(rename, "make_temp_file", read_only_make_temp_file)
+        client = make_client()
+
+        dest, is_temporary = asyncio.run(
+            stream_and_rename_wheel(client, "https://example.invalid/w.whl", "mypkg_v1", cache_path)
+        )
+
+        try:
+            assert is_temporary
+            assert not cache_path.exists()
+            with zipfile.ZipFile(dest) as zf:
+                assert "mypkg_v1/__init__.py" in zf.namelist()
+        finally:
+            dest.unlink()
+
+    def test_key_includes_renamer_version(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test wheels cached by a different spare-tire or cache format are not reused."""
+        args = (tmp_path, "https://example.invalid/w.whl", "sha256=abc", "mypkg_v1")
+        path = renamed_wheel_cache_path(*args)
+
+        monkeypatch.setattr(stream, "__version__", "999.0")
+        bumped_version = renamed_wheel_cache_path(*args)
+        monkeypatch.setattr(stream, "_RENAMED_CACHE_FORMAT", stream._RENAMED_CACHE_FORMAT + 1)
+        bumped_format = renamed_wheel_cache_path(*args)
+
+        assert len({path, bumped_version, bumped_format}) == 3
+
+    def test_prune_removes_least_recently_used(self, tmp_path: Path) -> None:
+        """Test pruning deletes the oldest wheels first and spares the kept one."""
+        wheels = [tmp_path / f"{i}.whl" for i in range(4)]
+        for i, wheel in enumerate(wheels):
+            wheel.write_bytes(b"x" * 100)
+            os.utime(wheel, (1000 + i, 1000 + i))
+        # A cache hit makes the oldest wheel the most recently used
+        assert use_cached_wheel(wheels[0])
+        assert not use_cached_wheel(tmp_path / "missing.whl")
+
+        prune_wheel_cache(tmp_path, 250, keep=wheels[1])
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["0.whl", "1.whl"]
+
+    def test_cache_pruned_after_write(self, tmp_path: Path) -> None:
+        """Test caching a new wheel evicts old ones beyond the size limit."""
+        cache_path = tmp_path / "cache" / "key.whl"
+        cache_path.parent.mkdir()
+        stale = cache_path.parent / "stale.whl"
+        stale.write_bytes(b"x" * 100)
+        os.utime(stale, (1000, 1000))
+
+        dest, _ = asyncio.run(
+            stream_and_rename_wheel(
+                make_client(), "https://example.invalid/w.whl", "mypkg_v1", cache_path, 1
+            )
+        )
+
+        assert dest == cache_path
+        assert [p.name for p in cache_path.parent.iterdir()] == ["key.whl"]
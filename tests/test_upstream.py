@@ -0,0 +1,60 @@
+"""Tests for the proxy server's upstream client."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from spare_tire.server.config import ProxyConfig
+from spare_tire.server.upstream import UpstreamClient, _lru_get, _lru_put
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestProjectPackages:
+    def test_other_upstream_tasks_finished(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test lower-priority lookups are settled, failed or cancelled, before returning."""
+
+        async def fake_fetch(
+            _self: UpstreamClient, upstream_url: str, _project: str
+        ) -> list[object] | None:
+            if "failing" in upstream_url:
+                raise RuntimeError("upstream failed")
+            if "slow" in upstream_url:
+                await asyncio.sleep(10)
+            return []
+
+        monkeypatch.setattr(UpstreamClient, "_fetch_project_wheels", fake_fetch)
+        config = ProxyConfig(
+            upstreams=[
+                "https://primary.invalid/simple/",
+                "https://failing.invalid/simple/",
+                "https://slow.invalid/simple/",
+            ]
+        )
+        errors: list[dict[str, object]] = []
+
+        async def get_packages() -> list[dict[str, str | None]]:
+            asyncio.get_running_loop().set_exception_handler(lambda _loop, ctx: errors.append(ctx))
+            packages = await UpstreamClient(config).get_project_page("mypkg")
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+            gc.collect()
+            return packages
+
+        assert asyncio.run(get_packages()) == []
+        assert errors == []
+
+
+class TestLRUCache:
+    def test_least_recently_used_evicted(self) -> None:
+        """Test the cache stays within its size, evicting the entry used longest ago."""
+        cache: OrderedDict[str, int] = OrderedDict()
+        _lru_put(cache, "a", 1, max_size=2)
+        _lru_put(cache, "b", 2, max_size=2)
+        assert _lru_get(cache, "a") == 1
+        _lru_put(cache, "c", 3, max_size=2)
+        assert list(cache) == ["a", "c"]
+        assert _lru_get(cache, "b") is None